@@ -0,0 +1,2 @@
+PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
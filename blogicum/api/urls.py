@@ -0,0 +1,42 @@
+from django.urls import include, path
+
+from api import views
+
+app_name = 'api'
+
+v1_urls = [
+    path(
+        'posts/',
+        views.PostListView.as_view(),
+        name='posts'
+    ),
+    path(
+        'posts/<int:post_id>/',
+        views.PostDetailView.as_view(),
+        name='post_detail'
+    ),
+    path(
+        'posts/<int:post_id>/comments/',
+        views.CommentListView.as_view(),
+        name='comments'
+    ),
+    path(
+        'categories/',
+        views.CategoryListView.as_view(),
+        name='categories'
+    ),
+    path(
+        'categories/<slug:category_slug>/posts/',
+        views.CategoryPostListView.as_view(),
+        name='category_posts'
+    ),
+    path(
+        'profiles/<str:username>/posts/',
+        views.ProfilePostListView.as_view(),
+        name='profile_posts'
+    ),
+]
+
+urlpatterns = [
+    path('v1/', include(v1_urls)),
+]
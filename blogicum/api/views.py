@@ -0,0 +1,303 @@
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Case, F, When
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views import View
+
+from api.constants import MAX_PAGE_SIZE, PAGE_SIZE
+from blog import scheduler
+from blog.cache import (
+    get_page_validator, get_tag_versions, page_etag, query_validator_key,
+    ref_tags, set_page_validator
+)
+from blog.models import Category, Comment, Post
+from blog.paginators import KeysetPaginator
+
+User = get_user_model()
+
+
+class ApiError(Exception):
+    pass
+
+
+def dumps(data):
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+
+
+def visible_posts():
+    return Post.objects.filter(
+        pub_date__lte=timezone.now(),
+        is_published=True,
+        category__is_published=True
+    )
+
+
+class ApiView(View):
+    model = None
+    fields = {}
+    ref_fields = ('id',)
+    ordering = ('-pub_date', '-id')
+    validator_params = ('fields', 'limit', 'after', 'before')
+
+    def get_validator_key(self):
+        params = []
+        for name in self.validator_params:
+            value = self.request.GET.get(name)
+            if name == 'fields' and value:
+                value = ','.join(sorted(
+                    {part.strip() for part in value.split(',')}
+                ))
+            if value:
+                params.append((name, value))
+        return query_validator_key(self.request.path, params)
+
+    def get_fields(self):
+        requested = self.request.GET.get('fields')
+        if not requested:
+            return list(self.fields)
+        names = [name.strip() for name in requested.split(',')]
+        unknown = set(names) - set(self.fields)
+        if unknown:
+            raise ApiError(
+                'Неизвестные поля: {}.'.format(', '.join(sorted(unknown)))
+            )
+        return names
+
+    def get_queryset(self, fields):
+        return self.model._default_manager.all()
+
+    def get_values(self, fields):
+        return self.get_queryset(fields).values(
+            *{self.fields[name] for name in fields}, *self.ref_fields
+        )
+
+    def get_scope_tags(self):
+        return ['pages:all']
+
+    def get_object_tags(self, rows):
+        return []
+
+    def serialize(self, row, fields):
+        return {name: row[self.fields[name]] for name in fields}
+
+    def get(self, request, *args, **kwargs):
+        scheduler.catch_up()
+        validator_key = self.get_validator_key()
+        validator = get_page_validator(validator_key)
+        if validator is not None:
+            response = get_conditional_response(
+                request, etag=validator['etag']
+            )
+            if response is not None:
+                response['ETag'] = validator['etag']
+                return response
+        try:
+            fields = self.get_fields()
+            versions = get_tag_versions(self.get_scope_tags())
+            rows, extra = self.get_rows(fields)
+        except ApiError as error:
+            return JsonResponse({'detail': str(error)}, status=400)
+        except Http404 as error:
+            return JsonResponse({'detail': str(error)}, status=404)
+        versions.update(get_tag_versions(
+            set(self.get_object_tags(rows)) - set(versions)
+        ))
+        etag = page_etag(versions)
+        set_page_validator(validator_key, versions, etag, int(time.time()))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self.render(rows, fields, extra)
+        response['ETag'] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            raise ApiError('Параметр limit должен быть положительным числом.')
+        return min(limit, MAX_PAGE_SIZE)
+
+    def get_rows(self, fields):
+        paginator = KeysetPaginator(
+            self.get_values(fields), self.get_limit(), self.ordering
+        )
+        try:
+            page = paginator.page(
+                after=self.request.GET.get('after'),
+                before=self.request.GET.get('before')
+            )
+        except InvalidPage as error:
+            raise ApiError(str(error))
+        return page.object_list, page
+
+    def page_url(self, name, cursor):
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query.pop('after', None)
+        query.pop('before', None)
+        query[name] = cursor
+        return self.request.build_absolute_uri(
+            f'{self.request.path}?{query.urlencode()}'
+        )
+
+    def stream(self, rows, fields, page):
+        yield '{"results": ['
+        for index, row in enumerate(rows):
+            yield (',' if index else '') + dumps(self.serialize(row, fields))
+        yield '], "next": {}, "previous": {}}}'.format(
+            dumps(self.page_url('after', page.next_cursor)),
+            dumps(self.page_url('before', page.previous_cursor))
+        )
+
+    def render(self, rows, fields, page):
+        return StreamingHttpResponse(
+            self.stream(rows, fields, page),
+            content_type='application/json'
+        )
+
+
+class PostFieldsMixin:
+    model = Post
+    fields = {
+        'id': 'id',
+        'title': 'title',
+        'text': 'text',
+        'pub_date': 'pub_date',
+        'updated_at': 'updated_at',
+        'author': 'author__username',
+        'category': 'category__slug',
+        'location': 'location_name',
+        'image': 'image',
+        'comment_count': 'comment_count',
+    }
+    ref_fields = ('id', 'pub_date', 'author_id', 'category_id', 'location_id')
+
+    def get_queryset(self, fields):
+        posts = visible_posts()
+        if 'location' in fields:
+            posts = posts.annotate(location_name=Case(When(
+                location__is_published=True, then=F('location__name')
+            )))
+        return posts
+
+    def get_object_tags(self, rows):
+        return [
+            tag for row in rows for tag in ref_tags(
+                row['id'], row['author_id'], row['category_id'],
+                row['location_id']
+            )
+        ]
+
+    def serialize(self, row, fields):
+        data = super().serialize(row, fields)
+        if data.get('image'):
+            data['image'] = self.request.build_absolute_uri(
+                default_storage.url(data['image'])
+            )
+        elif 'image' in data:
+            data['image'] = None
+        return data
+
+
+class PostListView(PostFieldsMixin, ApiView):
+
+    def get_scope_tags(self):
+        return ['pages:all', 'pages:feed']
+
+
+class CategoryPostListView(PostListView):
+
+    def get_scope_tags(self):
+        return [
+            'pages:all', f'pages:category-feed:{self.kwargs["category_slug"]}'
+        ]
+
+    def get_queryset(self, fields):
+        category_id = Category.objects.filter(
+            slug=self.kwargs['category_slug'], is_published=True
+        ).values_list('pk', flat=True).first()
+        if category_id is None:
+            raise Http404('Категория не найдена.')
+        return super().get_queryset(fields).filter(category_id=category_id)
+
+
+class ProfilePostListView(PostListView):
+
+    def get_scope_tags(self):
+        return ['pages:all', f'pages:author-feed:{self.kwargs["username"]}']
+
+    def get_queryset(self, fields):
+        author_id = User.objects.filter(
+            username=self.kwargs['username']
+        ).values_list('pk', flat=True).first()
+        if author_id is None:
+            raise Http404('Пользователь не найден.')
+        return super().get_queryset(fields).filter(author_id=author_id)
+
+
+class PostDetailView(PostFieldsMixin, ApiView):
+
+    def get_scope_tags(self):
+        return ['pages:all', f'pages:post:{self.kwargs["post_id"]}']
+
+    def get_rows(self, fields):
+        rows = list(self.get_values(fields).filter(pk=self.kwargs['post_id']))
+        if not rows:
+            raise Http404('Публикация не найдена.')
+        return rows, None
+
+    def render(self, rows, fields, extra):
+        return JsonResponse(
+            self.serialize(rows[0], fields),
+            json_dumps_params={'ensure_ascii': False}
+        )
+
+
+class CommentListView(ApiView):
+    model = Comment
+    fields = {
+        'id': 'id',
+        'text': 'text',
+        'created_at': 'created_at',
+        'author': 'author__username',
+    }
+    ref_fields = ('id', 'created_at', 'author_id')
+    ordering = ('created_at', 'id')
+
+    def get_scope_tags(self):
+        return ['pages:all', f'pages:post:{self.kwargs["post_id"]}']
+
+    def get_queryset(self, fields):
+        if not visible_posts().filter(pk=self.kwargs['post_id']).exists():
+            raise Http404('Публикация не найдена.')
+        return Comment.objects.filter(post_id=self.kwargs['post_id'])
+
+    def get_object_tags(self, rows):
+        return [f'pages:author:{row["author_id"]}' for row in rows]
+
+
+class CategoryListView(ApiView):
+    model = Category
+    fields = {
+        'slug': 'slug',
+        'title': 'title',
+        'description': 'description',
+    }
+    ordering = ('id',)
+
+    def get_scope_tags(self):
+        return ['categories']
+
+    def get_queryset(self, fields):
+        return super().get_queryset(fields).filter(is_published=True)
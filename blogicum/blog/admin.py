@@ -1,10 +1,58 @@
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.http import Http404
+from django.template.response import TemplateResponse
+from django.urls import path
 
+from blog import search
 from blog.models import Category, Comment, Location, Post
 
 
+class InputFilter(admin.SimpleListFilter):
+    template = 'admin/input_filter.html'
+    lookup = None
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self):
+        return True
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.lookup: self.value().strip()})
+        return queryset
+
+    def choices(self, changelist):
+        all_choice = next(super().choices(changelist))
+        all_choice['query_parts'] = [
+            (name, value)
+            for name, value in changelist.params.items()
+            if name != self.parameter_name
+        ]
+        yield all_choice
+
+
+class AuthorFilter(InputFilter):
+    title = 'автор'
+    parameter_name = 'author'
+    lookup = 'author__username'
+
+
+class CategoryFilter(InputFilter):
+    title = 'категория'
+    parameter_name = 'category'
+    lookup = 'category__slug'
+
+
+class HighVolumeAdmin(admin.ModelAdmin):
+    show_full_result_count = False
+
+
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(HighVolumeAdmin):
     list_display = (
         'author',
         'created_at',
@@ -16,24 +64,63 @@ class PostAdmin(admin.ModelAdmin):
         'title',
         'text'
     )
+    list_select_related = ('author',)
     search_fields = (
         'title',
         'text',
-        'author__username'
+        '=author__username'
     )
-    list_filter = ('title', 'author')
+    list_filter = ('is_published', AuthorFilter, CategoryFilter)
+    autocomplete_fields = ('author', 'category', 'location')
 
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not search.search_terms(term) or not search.is_supported():
+            return super().get_search_results(
+                request, queryset, search_term
+            )
+        return queryset.filter(
+            Q(pk__in=search.matching_ids(term)) | Q(author__username=term)
+        ), False
 
-class PostInline(admin.StackedInline):
-    model = Post
-    extra = 0
+
+class RelatedPostsAdmin(admin.ModelAdmin):
+    change_form_template = 'admin/blog/related_posts_change_form.html'
+    related_posts_field = None
+    related_posts_per_page = 20
+
+    def get_urls(self):
+        opts = self.model._meta
+        return [
+            path(
+                '<path:object_id>/posts/',
+                self.admin_site.admin_view(self.related_posts_view),
+                name=f'{opts.app_label}_{opts.model_name}_posts'
+            ),
+        ] + super().get_urls()
+
+    def related_posts_view(self, request, object_id):
+        obj = self.get_object(request, object_id)
+        if obj is None:
+            raise Http404('Объект не найден.')
+        if not self.has_view_or_change_permission(request, obj):
+            raise PermissionDenied
+        posts = Post.objects.filter(
+            **{self.related_posts_field: obj}
+        ).select_related('author').only(
+            'title', 'pub_date', 'is_published', 'author__username'
+        ).order_by('-pub_date', '-id')
+        paginator = Paginator(posts, self.related_posts_per_page)
+        return TemplateResponse(
+            request,
+            'admin/blog/related_posts.html',
+            {'page_obj': paginator.get_page(request.GET.get('page'))}
+        )
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
-    inlines = (
-        PostInline,
-    )
+class CategoryAdmin(RelatedPostsAdmin):
+    related_posts_field = 'category'
     list_display = (
         'title',
         'description',
@@ -48,19 +135,24 @@ class CategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Location)
-class LocationAdmin(admin.ModelAdmin):
-    inlines = (PostInline,)
+class LocationAdmin(RelatedPostsAdmin):
+    related_posts_field = 'location'
     list_display = ('name',)
     search_fields = ('name',)
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(HighVolumeAdmin):
     list_display = (
         'text',
         'created_at',
         'author',
+        'post',
     )
+    list_select_related = ('author', 'post')
+    search_fields = ('=author__username',)
+    list_filter = (AuthorFilter,)
+    autocomplete_fields = ('author', 'post')
 
 
 admin.site.empty_value_display = 'Не задано'
@@ -0,0 +1,172 @@
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import urlencode
+
+TAG_KEY = 'blog:tag:{}'
+PAGE_KEY = 'blog:page:{}'
+VALIDATOR_KEY = 'blog:validator:{}:{}'
+NEXT_DUE_KEY = 'blog:next-due'
+
+
+def get_tag_versions(tags):
+    keys = {TAG_KEY.format(tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+    missing = {key: uuid4().hex for key in keys if key not in versions}
+    for key, version in missing.items():
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+        versions[key] = version
+    return {tag: versions[key] for key, tag in keys.items()}
+
+
+def bump_tags(*tags):
+    cache.set_many(
+        {TAG_KEY.format(tag): uuid4().hex for tag in set(tags)},
+        timeout=None
+    )
+
+
+def feed_tags(category_id=None, author_id=None):
+    if category_id is not None:
+        return [f'posts:category:{category_id}', 'categories']
+    if author_id is not None:
+        return [f'posts:author:{author_id}', 'categories']
+    return ['posts', 'categories']
+
+
+def post_tags(category_id, author_id):
+    return [
+        'posts',
+        f'posts:category:{category_id}',
+        f'posts:author:{author_id}',
+    ]
+
+
+def post_page_tags(category_slug, username):
+    return [
+        'pages:feed',
+        f'pages:category-feed:{category_slug}',
+        f'pages:author-feed:{username}',
+    ]
+
+
+def ref_tags(post_id, author_id, category_id, location_id=None):
+    tags = [
+        f'pages:post:{post_id}',
+        f'pages:author:{author_id}',
+        f'pages:category:{category_id}',
+    ]
+    if location_id is not None:
+        tags.append(f'pages:location:{location_id}')
+    return tags
+
+
+def post_ref_tags(post):
+    return ref_tags(
+        post.pk, post.author_id, post.category_id, post.location_id
+    )
+
+
+def page_cache_key(request):
+    path = md5(request.get_full_path().encode()).hexdigest()
+    return PAGE_KEY.format(path)
+
+
+def feed_cache_key(kind, *parts):
+    name = md5(':'.join((kind, *parts)).encode()).hexdigest()
+    return PAGE_KEY.format(f'feed:{name}')
+
+
+def page_client(request):
+    if not request.user.is_authenticated:
+        return None
+    raw = '|'.join((
+        str(request.user.pk),
+        request.session.session_key or '',
+        request.META.get('CSRF_COOKIE', ''),
+    ))
+    return md5(raw.encode()).hexdigest()
+
+
+def page_validator_key(request):
+    path = md5(request.get_full_path().encode()).hexdigest()
+    return VALIDATOR_KEY.format(path, page_client(request) or 0)
+
+
+def query_validator_key(path, params):
+    raw = '{}?{}'.format(path, urlencode(params))
+    return VALIDATOR_KEY.format(md5(raw.encode()).hexdigest(), 0)
+
+
+def page_etag(versions, client=None):
+    raw = '|'.join(f'{tag}={versions[tag]}' for tag in sorted(versions))
+    return '"{}"'.format(md5(f'{client}|{raw}'.encode()).hexdigest())
+
+
+def get_page_validator(key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if get_tag_versions(entry['tags']) != entry['tags']:
+        return None
+    return entry
+
+
+def set_page_validator(key, versions, etag, last_modified):
+    cache.set(
+        key,
+        {'tags': versions, 'etag': etag, 'last_modified': last_modified},
+        settings.BLOG_PAGE_CACHE_TIMEOUT
+    )
+
+
+def get_cached_page(key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if get_tag_versions(entry['tags']) != entry['tags']:
+        return None
+    response = HttpResponse(
+        entry['content'],
+        content_type=entry['content_type'],
+        status=entry['status']
+    )
+    for header, value in entry['headers'].items():
+        response[header] = value
+    response.preload_static = entry.get('preload_static', False)
+    return response
+
+
+def set_cached_page(key, response, versions, preload_static=False):
+    cache.set(
+        key,
+        {
+            'tags': versions,
+            'preload_static': preload_static,
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'status': response.status_code,
+            'headers': {
+                header: response[header]
+                for header in ('ETag', 'Last-Modified', 'Cache-Control')
+                if response.has_header(header)
+            },
+        },
+        settings.BLOG_PAGE_CACHE_TIMEOUT
+    )
+
+
+def get_next_due():
+    return cache.get(NEXT_DUE_KEY)
+
+
+def set_next_due(timestamp):
+    cache.set(NEXT_DUE_KEY, timestamp, settings.BLOG_PAGE_CACHE_TIMEOUT)
+
+
+def reset_next_due():
+    cache.delete(NEXT_DUE_KEY)
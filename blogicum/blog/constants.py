@@ -1,3 +1,7 @@
+LIMIT_COMMENTS = 10
+LIMIT_FEED_ITEMS = 20
 LIMIT_POST = 10
 LIMIT_WORDS = 30
 MAX_LENGTH = 256
+PAGES_ON_EACH_SIDE = 2
+PAGES_ON_ENDS = 1
@@ -0,0 +1,132 @@
+import csv
+import gzip
+import io
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from blog.models import Comment, Post
+
+EXPORTS = {
+    'posts': (Post, (
+        ('id', 'id'),
+        ('title', 'title'),
+        ('text', 'text'),
+        ('pub_date', 'pub_date'),
+        ('is_published', 'is_published'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+        ('category', 'category__slug'),
+        ('author', 'author__username'),
+        ('location', 'location__name'),
+        ('image', 'image'),
+        ('comment_count', 'comment_count'),
+    )),
+    'comments': (Comment, (
+        ('id', 'id'),
+        ('post', 'post_id'),
+        ('author', 'author__username'),
+        ('text', 'text'),
+        ('created_at', 'created_at'),
+    )),
+}
+CHUNK_SIZE = 2000
+BUFFER_SIZE = 2 ** 20
+
+
+class Output:
+
+    def __init__(self, path, compress=False, offset=None):
+        if offset is None:
+            self.file = io.open(path, 'wb', buffering=BUFFER_SIZE)
+        else:
+            self.file = io.open(path, 'r+b', buffering=BUFFER_SIZE)
+            self.file.seek(offset)
+            self.file.truncate()
+        self.compress = compress
+        self.chunk = []
+
+    def write(self, data):
+        self.chunk.append(data)
+        return len(data)
+
+    def flush(self):
+        data = ''.join(self.chunk).encode()
+        self.chunk = []
+        if data:
+            self.file.write(gzip.compress(data) if self.compress else data)
+        self.file.flush()
+        return self.file.tell()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.file.close()
+
+
+class Exporter:
+
+    def __init__(self, name, output, dump_format='jsonl',
+                 chunk_size=CHUNK_SIZE, after=0, header=True,
+                 checkpoint=None):
+        self.model, fields = EXPORTS[name]
+        self.columns = [column for column, lookup in fields]
+        self.lookups = [lookup for column, lookup in fields]
+        self.output = output
+        self.dump_format = dump_format
+        self.chunk_size = chunk_size
+        self.after = after
+        self.header = header
+        self.checkpoint = checkpoint
+        self.exported = 0
+        self.last_pk = after
+        self.started = None
+
+    def rows(self):
+        return self.model.objects.filter(pk__gt=self.after).order_by(
+            'pk'
+        ).values_list(*self.lookups).iterator(chunk_size=self.chunk_size)
+
+    def get_writer(self):
+        if self.dump_format == 'csv':
+            writer = csv.writer(self.output)
+            if self.header:
+                writer.writerow(self.columns)
+            return lambda row: writer.writerow([
+                value.isoformat() if hasattr(value, 'isoformat') else value
+                for value in row
+            ])
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        return lambda row: self.output.write(
+            encoder.encode(dict(zip(self.columns, row))) + '\n'
+        )
+
+    def save_checkpoint(self):
+        offset = self.output.flush()
+        if self.checkpoint is not None:
+            self.checkpoint(self.last_pk, offset)
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self):
+        return self.exported / self.elapsed if self.elapsed else 0
+
+    def run(self):
+        self.started = time.monotonic()
+        write = self.get_writer()
+        for row in self.rows():
+            write(row)
+            self.last_pk = row[0]
+            self.exported += 1
+            if not self.exported % self.chunk_size:
+                self.save_checkpoint()
+        self.save_checkpoint()
+        return self.exported
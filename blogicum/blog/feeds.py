@@ -0,0 +1,163 @@
+import time
+from copy import copy
+
+from django.contrib.auth import get_user_model
+from django.contrib.syndication.views import Feed
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, parse_http_date_safe
+
+from blog import scheduler
+from blog.cache import (
+    feed_cache_key, get_cached_page, get_tag_versions, page_etag,
+    post_ref_tags, set_cached_page
+)
+from blog.constants import LIMIT_FEED_ITEMS
+from blog.models import Category, Post
+
+User = get_user_model()
+
+
+class PostFeed(Feed):
+    title = 'Блогикум'
+    description = 'Новые публикации в Блогикуме'
+
+    def __call__(self, request, *args, **kwargs):
+        scheduler.catch_up()
+        key = feed_cache_key(
+            type(self).__name__, request.scheme, request.get_host(),
+            *kwargs.values()
+        )
+        response = get_cached_page(key)
+        if response is None:
+            feed = copy(self)
+            feed.object_tags = set()
+            versions = get_tag_versions(feed.get_feed_tags(**kwargs))
+            response = Feed.__call__(feed, request, *args, **kwargs)
+            versions.update(
+                get_tag_versions(feed.object_tags - set(versions))
+            )
+            response['ETag'] = page_etag(versions)
+            response['Last-Modified'] = http_date(time.time())
+            patch_cache_control(response, no_cache=True, public=True)
+            set_cached_page(key, response, versions)
+        not_modified = get_conditional_response(
+            request,
+            etag=response['ETag'],
+            last_modified=parse_http_date_safe(response['Last-Modified']),
+            response=response
+        )
+        return not_modified or response
+
+    def get_feed_tags(self, **kwargs):
+        return ['pages:all', 'pages:feed']
+
+    def link(self, obj):
+        return reverse('blog:index')
+
+    def get_posts(self, obj):
+        return {}
+
+    def items(self, obj):
+        posts = Post.objects.select_related('category', 'author').filter(
+            pub_date__lte=timezone.now(),
+            is_published=True,
+            category__is_published=True,
+            **self.get_posts(obj)
+        ).order_by('-pub_date', '-id')[:LIMIT_FEED_ITEMS]
+        for post in posts.iterator():
+            self.object_tags.update(post_ref_tags(post))
+            yield post
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.text
+
+    def item_link(self, item):
+        return reverse('blog:post_detail', kwargs={'post_id': item.pk})
+
+    def item_pubdate(self, item):
+        return item.pub_date
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_author_name(self, item):
+        return item.author.username
+
+    def item_categories(self, item):
+        return (item.category.title,)
+
+
+class CategoryPostFeed(PostFeed):
+
+    def get_feed_tags(self, category_slug):
+        return ['pages:all', f'pages:category-feed:{category_slug}']
+
+    def get_object(self, request, category_slug):
+        category = get_object_or_404(
+            Category, slug=category_slug, is_published=True
+        )
+        self.object_tags.add(f'pages:category:{category.pk}')
+        return category
+
+    def title(self, obj):
+        return f'Блогикум: {obj.title}'
+
+    def description(self, obj):
+        return obj.description
+
+    def link(self, obj):
+        return reverse(
+            'blog:category_posts', kwargs={'category_slug': obj.slug}
+        )
+
+    def get_posts(self, obj):
+        return {'category': obj}
+
+
+class AuthorPostFeed(PostFeed):
+
+    def get_feed_tags(self, username):
+        return ['pages:all', f'pages:author-feed:{username}']
+
+    def get_object(self, request, username):
+        author = get_object_or_404(User, username=username)
+        self.object_tags.add(f'pages:author:{author.pk}')
+        return author
+
+    def title(self, obj):
+        return f'Блогикум: публикации {obj.username}'
+
+    def description(self, obj):
+        return f'Новые публикации пользователя {obj.username}'
+
+    def link(self, obj):
+        return reverse('blog:profile', kwargs={'username': obj.username})
+
+    def get_posts(self, obj):
+        return {'author': obj}
+
+
+class AtomPostFeed(PostFeed):
+    feed_type = Atom1Feed
+    subtitle = PostFeed.description
+
+
+class AtomCategoryPostFeed(CategoryPostFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return obj.description
+
+
+class AtomAuthorPostFeed(AuthorPostFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
@@ -2,6 +2,7 @@ from django import forms
 from django.contrib.auth import get_user_model
 
 from blog.models import Comment, Post
+from blog.uploads import HeaderCheckedImageField
 
 
 class PostForm(forms.ModelForm):
@@ -9,6 +10,7 @@ class PostForm(forms.ModelForm):
     class Meta:
         model = Post
         exclude = ('author',)
+        field_classes = {'image': HeaderCheckedImageField}
         widgets = {
             'text': forms.Textarea(
                 {'cols': '22', 'rows': '5'}
@@ -0,0 +1,41 @@
+from django.http import Http404
+
+MISSING = object()
+
+
+class IdentityMap:
+
+    def __init__(self):
+        self._objects = {}
+
+    def _key(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        return queryset.model._meta.label, queryset.db, sql, repr(params)
+
+    def get(self, queryset, **lookup):
+        if isinstance(queryset, type):
+            queryset = queryset._default_manager.all()
+        key = self._key(queryset.filter(**lookup))
+        obj = self._objects.get(key, MISSING)
+        if obj is MISSING:
+            try:
+                obj = queryset.get(**lookup)
+            except queryset.model.DoesNotExist:
+                obj = None
+            self._objects[key] = obj
+        return obj
+
+    def get_or_404(self, queryset, **lookup):
+        obj = self.get(queryset, **lookup)
+        if obj is None:
+            model = getattr(queryset, 'model', queryset)
+            raise Http404(
+                f'{model._meta.verbose_name} по запросу {lookup} не найден.'
+            )
+        return obj
+
+
+def get_identity_map(request):
+    if not hasattr(request, '_identity_map'):
+        request._identity_map = IdentityMap()
+    return request._identity_map
@@ -0,0 +1,266 @@
+import gzip
+import io
+import json
+import re
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+
+from blog import read_model, search
+from blog.cache import bump_tags
+
+IMPORT_MODELS = (
+    'auth.user',
+    'blog.category',
+    'blog.location',
+    'blog.post',
+    'blog.comment',
+)
+NATURAL_KEYS = {
+    'auth.user': 'username',
+    'blog.category': 'slug',
+}
+BATCH_SIZE = 1000
+READ_SIZE = 2 ** 16
+SEPARATOR = re.compile(r'\s*(?:,\s*)?')
+
+
+class DumpError(Exception):
+    pass
+
+
+def open_dump(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return io.open(path, encoding='utf-8')
+
+
+def iter_json(stream, read_size=READ_SIZE):
+    decoder = json.JSONDecoder()
+    buffer = stream.read(read_size).lstrip()
+    if not buffer.startswith('['):
+        raise DumpError('Дамп должен быть JSON-массивом объектов.')
+    position = 1
+    while True:
+        position = SEPARATOR.match(buffer, position).end()
+        if buffer.startswith(']', position):
+            return
+        if buffer.startswith('{', position):
+            try:
+                obj, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                pass
+            else:
+                yield obj
+                continue
+        elif position < len(buffer):
+            raise DumpError('Дамп должен быть JSON-массивом объектов.')
+        chunk = stream.read(max(read_size, len(buffer) - position))
+        if not chunk:
+            raise DumpError('Дамп оборвался на середине объекта.')
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def iter_jsonl(stream):
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            raise DumpError(f'Строка {number} не является JSON-объектом.')
+
+
+def auto_timestamp_fields(models):
+    return [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False)
+        or getattr(field, 'auto_now_add', False)
+    ]
+
+
+@contextmanager
+def kept_timestamps(fields):
+    flags = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in flags:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Importer:
+
+    def __init__(self, using=DEFAULT_DB_ALIAS, batch_size=BATCH_SIZE,
+                 send_signals=True, check_constraints=True, append=False,
+                 progress=None):
+        self.using = using
+        self.batch_size = batch_size
+        self.send_signals = send_signals
+        self.check_constraints = check_constraints
+        self.progress = progress
+        self.models = {
+            label: apps.get_model(label) for label in IMPORT_MODELS
+        }
+        self.id_offsets = {
+            model: self.get_id_offset(model) if append else 0
+            for model in self.models.values()
+        }
+        self.id_maps = {model: {} for model in self.models.values()}
+        self.timestamp_fields = auto_timestamp_fields(self.models.values())
+        self.buffers = {model: [] for model in self.models.values()}
+        self.buffered = 0
+        self.loaded = 0
+        self.skipped = {}
+        self.matched = {}
+        self.started = None
+
+    def get_id_offset(self, model):
+        return model._base_manager.using(self.using).aggregate(
+            last=Max('pk')
+        )['last'] or 0
+
+    def get_model(self, record):
+        return self.models.get(str(record.get('model', '')).lower())
+
+    def prepare(self, records):
+        keys = {model: {} for model in self.models.values()}
+        for record in records:
+            model = self.get_model(record)
+            if model is not None and model._meta.label_lower in NATURAL_KEYS:
+                name = NATURAL_KEYS[model._meta.label_lower]
+                value = record.get('fields', {}).get(name)
+                if value is not None:
+                    keys[model][value] = self.to_pk(model, record.get('pk'))
+        for model, sources in keys.items():
+            name = NATURAL_KEYS.get(model._meta.label_lower)
+            values = list(sources)
+            for start in range(0, len(values), self.batch_size):
+                existing = model._base_manager.using(self.using).filter(**{
+                    f'{name}__in': values[start:start + self.batch_size]
+                }).values_list(name, 'pk')
+                for value, pk in existing:
+                    self.id_maps[model][sources[value]] = pk
+
+    def to_pk(self, model, value):
+        if isinstance(value, (list, dict)):
+            raise DumpError(
+                'Натуральные ключи не поддерживаются, нужны числовые id.'
+            )
+        return model._meta.pk.to_python(value)
+
+    def resolve_id(self, model, value):
+        if value is None or model not in self.id_offsets:
+            return value
+        value = self.to_pk(model, value)
+        if value in self.id_maps[model]:
+            return self.id_maps[model][value]
+        return value + self.id_offsets[model]
+
+    def build(self, model, record):
+        if record.get('pk') is None:
+            raise DumpError(f'У объекта {record["model"]} нет pk.')
+        values = {
+            model._meta.pk.attname: self.resolve_id(model, record['pk'])
+        }
+        fields = record.get('fields', {})
+        for field in model._meta.concrete_fields:
+            if field.primary_key:
+                continue
+            if field.name not in fields:
+                if field in self.timestamp_fields:
+                    values[field.attname] = field.to_python(
+                        fields.get('created_at') or timezone.now()
+                    )
+                continue
+            value = fields[field.name]
+            if field.many_to_one or field.one_to_one:
+                values[field.attname] = self.resolve_id(
+                    field.related_model, value
+                )
+            else:
+                values[field.attname] = field.to_python(value)
+        return model(**values)
+
+    def add(self, record):
+        model = self.get_model(record)
+        if model is None:
+            label = record.get('model', '?')
+            self.skipped[label] = self.skipped.get(label, 0) + 1
+            return
+        if self.to_pk(model, record.get('pk')) in self.id_maps[model]:
+            label = model._meta.label_lower
+            self.matched[label] = self.matched.get(label, 0) + 1
+            return
+        self.buffers[model].append(self.build(model, record))
+        self.buffered += 1
+        if self.buffered >= self.batch_size:
+            self.flush()
+
+    def save(self, model, objs):
+        if self.send_signals:
+            for obj in objs:
+                pre_save.send(
+                    sender=model, instance=obj, raw=True, using=self.using,
+                    update_fields=None
+                )
+        model._base_manager.using(self.using).bulk_create(
+            objs, batch_size=self.batch_size
+        )
+        if self.send_signals:
+            for obj in objs:
+                post_save.send(
+                    sender=model, instance=obj, created=True, raw=True,
+                    using=self.using, update_fields=None
+                )
+
+    def flush(self):
+        if not self.buffered:
+            return
+        with transaction.atomic(using=self.using):
+            for model, objs in self.buffers.items():
+                if objs:
+                    self.save(model, objs)
+                    objs.clear()
+        self.loaded += self.buffered
+        self.buffered = 0
+        if self.progress is not None:
+            self.progress(self.loaded, self.rate)
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self):
+        return self.loaded / self.elapsed if self.elapsed else 0
+
+    def run(self, records):
+        self.started = time.monotonic()
+        connection = connections[self.using]
+        with ExitStack() as stack:
+            stack.enter_context(kept_timestamps(self.timestamp_fields))
+            if not self.check_constraints:
+                stack.enter_context(connection.constraint_checks_disabled())
+            for record in records:
+                self.add(record)
+            self.flush()
+        if not self.check_constraints:
+            connection.check_constraints(table_names=[
+                model._meta.db_table for model in self.models.values()
+            ])
+        self.refresh_derived_data()
+        return self.loaded
+
+    def refresh_derived_data(self):
+        read_model.rebuild(batch_size=self.batch_size)
+        search.rebuild(batch_size=self.batch_size)
+        bump_tags('pages:all', 'posts', 'categories')
@@ -0,0 +1,92 @@
+import os
+from functools import partial
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog import exporter
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково выгружает публикации или комментарии в JSONL или CSV, '
+        'при необходимости со сжатием gzip.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            choices=tuple(exporter.EXPORTS),
+            help='Что выгружать.'
+        )
+        parser.add_argument('path', help='Путь к файлу выгрузки.')
+        parser.add_argument(
+            '--format',
+            dest='dump_format',
+            choices=('jsonl', 'csv'),
+            help='Формат выгрузки; по умолчанию определяется по расширению.'
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Сжимать выгрузку; включается сам для файлов .gz.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=exporter.CHUNK_SIZE,
+            help='Сколько строк читать из базы за один раз.'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help=(
+                'Файл с последним выгруженным pk и размером выгрузки. Если '
+                'он есть, файл обрезается до этого размера и выгрузка '
+                'продолжается со следующего pk.'
+            )
+        )
+
+    def read_checkpoint(self, path, output_path):
+        if path is None or not (
+            os.path.exists(path) and os.path.exists(output_path)
+        ):
+            return 0, None
+        try:
+            with open(path) as stream:
+                pk, offset = stream.read().split()
+            return int(pk), int(offset)
+        except ValueError:
+            raise CommandError(
+                f'В файле {path} должны быть pk и смещение в байтах.'
+            )
+
+    def write_checkpoint(self, path, pk, offset):
+        with open(path, 'w') as stream:
+            stream.write(f'{pk} {offset}\n')
+
+    def handle(self, *args, model, path, dump_format, gzip, chunk_size,
+               checkpoint, **options):
+        name = path[:-3] if path.endswith('.gz') else path
+        compress = gzip or path.endswith('.gz')
+        if dump_format is None:
+            dump_format = 'csv' if name.endswith('.csv') else 'jsonl'
+        after, offset = self.read_checkpoint(checkpoint, path)
+        try:
+            with exporter.Output(path, compress, offset) as output:
+                dump = exporter.Exporter(
+                    model,
+                    output,
+                    dump_format=dump_format,
+                    chunk_size=chunk_size,
+                    after=after,
+                    header=offset is None,
+                    checkpoint=checkpoint and partial(
+                        self.write_checkpoint, checkpoint
+                    )
+                )
+                exported = dump.run()
+        except OSError as error:
+            raise CommandError(f'Не удалось записать выгрузку: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Выгружено строк: {exported} за {dump.elapsed:.1f} с '
+            f'({dump.rate:.0f} в секунду), последний pk: {dump.last_pk}.'
+        ))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from blog import thumbnails
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Готовит превью для публикаций, у которых их ещё нет.'
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').filter(
+            has_thumbnails=False
+        ).values_list('pk', 'image')
+        count = 0
+        for pk, name in posts.iterator():
+            thumbnails.generate(pk, name)
+            count += 1
+        thumbnails.wait()
+        self.stdout.write(self.style.SUCCESS(
+            f'Превью поставлены в очередь для публикаций: {count}.'
+        ))
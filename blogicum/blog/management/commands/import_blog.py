@@ -0,0 +1,106 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, IntegrityError
+
+from blog import importer
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково загружает дамп блога (JSON-массив как у dumpdata или '
+        'JSONL, можно в .gz) пакетами через bulk_create.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к файлу дампа.')
+        parser.add_argument(
+            '--format',
+            dest='dump_format',
+            choices=('json', 'jsonl'),
+            help='Формат дампа; по умолчанию определяется по расширению.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=importer.BATCH_SIZE,
+            help='Сколько объектов сохранять в одной транзакции.'
+        )
+        parser.add_argument(
+            '--append',
+            action='store_true',
+            help=(
+                'Сдвинуть id объектов дампа за последние id в базе, '
+                'чтобы загрузить его рядом с существующими данными.'
+            )
+        )
+        parser.add_argument(
+            '--no-signals',
+            action='store_true',
+            help=(
+                'Не отправлять pre_save/post_save (raw=True) для каждого '
+                'объекта.'
+            )
+        )
+        parser.add_argument(
+            '--no-constraint-checks',
+            action='store_true',
+            help=(
+                'Отключить проверку внешних ключей на время загрузки и '
+                'проверить их один раз в конце.'
+            )
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='База данных для загрузки.'
+        )
+
+    def report_progress(self, loaded, rate):
+        if self.verbosity > 1:
+            self.stdout.write(
+                f'Загружено объектов: {loaded} ({rate:.0f} в секунду).'
+            )
+
+    def handle(self, *args, path, dump_format, batch_size, append,
+               no_signals, no_constraint_checks, database, verbosity,
+               **options):
+        self.verbosity = verbosity
+        if dump_format is None:
+            name = path[:-3] if path.endswith('.gz') else path
+            dump_format = 'jsonl' if name.endswith('.jsonl') else 'json'
+        loader = importer.Importer(
+            using=database,
+            batch_size=batch_size,
+            send_signals=not no_signals,
+            check_constraints=not no_constraint_checks,
+            append=append,
+            progress=self.report_progress
+        )
+        read = (
+            importer.iter_jsonl if dump_format == 'jsonl'
+            else importer.iter_json
+        )
+        try:
+            with importer.open_dump(path) as stream:
+                loader.prepare(read(stream))
+            with importer.open_dump(path) as stream:
+                loaded = loader.run(read(stream))
+        except (OSError, importer.DumpError, IntegrityError) as error:
+            raise CommandError(f'Не удалось загрузить дамп: {error}')
+        call_command(
+            'recount_comments',
+            batch_size=batch_size,
+            stdout=self.stdout
+        )
+        for label, count in sorted(loader.matched.items()):
+            self.stdout.write(
+                f'Уже есть в базе, сопоставлено объектов {label}: {count}.'
+            )
+        for label, count in sorted(loader.skipped.items()):
+            self.stdout.write(self.style.WARNING(
+                f'Пропущено объектов {label}: {count}.'
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            f'Загружено объектов: {loaded} за {loader.elapsed:.1f} с '
+            f'({loader.rate:.0f} в секунду).'
+        ))
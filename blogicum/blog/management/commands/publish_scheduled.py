@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from blog.scheduler import PublicationScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        'Публикует отложенные посты, время которых наступило. '
+        'Без --once работает как фоновый процесс.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Обработать наступившие публикации и выйти.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=60,
+            help='Наибольшая пауза между проверками, в секундах.'
+        )
+
+    def handle(self, *args, once, interval, **options):
+        scheduler = PublicationScheduler()
+        if once:
+            published = scheduler.publish_due()
+            self.stdout.write(self.style.SUCCESS(
+                f'Опубликовано отложенных постов: {published}.'
+            ))
+            return
+        scheduler.run(max_interval=interval)
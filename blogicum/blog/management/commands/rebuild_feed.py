@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from blog import read_model
+
+
+class Command(BaseCommand):
+    help = 'Пересобирает записи лент из таблицы публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=read_model.REBUILD_BATCH_SIZE,
+            help='Сколько публикаций обрабатывать за один проход.'
+        )
+
+    def handle(self, *args, batch_size, **options):
+        posts = read_model.rebuild(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'Записи лент пересобраны для публикаций: {posts}.'
+        ))
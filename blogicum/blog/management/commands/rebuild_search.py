@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from blog import search
+
+
+class Command(BaseCommand):
+    help = 'Пересобирает полнотекстовый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=search.REBUILD_BATCH_SIZE,
+            help='Сколько публикаций индексировать за один проход.'
+        )
+
+    def handle(self, *args, batch_size, **options):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING(
+                'Полнотекстовый индекс доступен только для SQLite.'
+            ))
+            return
+        posts = search.rebuild(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'Полнотекстовый индекс пересобран для публикаций: {posts}.'
+        ))
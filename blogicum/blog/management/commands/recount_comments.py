@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Сверяет счётчики комментариев публикаций с таблицей комментариев.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Сколько публикаций проверять за один проход.'
+        )
+
+    def handle(self, *args, batch_size, **options):
+        last_pk = 0
+        checked = fixed = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk').only(
+                    'pk', 'comment_count'
+                )[:batch_size]
+            )
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+            counts = dict(
+                Comment.objects.filter(
+                    post_id__gte=posts[0].pk,
+                    post_id__lte=last_pk
+                ).values_list('post_id').annotate(count=Count('pk'))
+                .order_by()
+            )
+            drifted = [
+                post.pk for post in posts
+                if post.comment_count != counts.get(post.pk, 0)
+            ]
+            if drifted:
+                Post.objects.filter(pk__in=drifted).update(
+                    comment_count=Coalesce(Subquery(
+                        Comment.objects.filter(
+                            post=OuterRef('pk')
+                        ).values('post').annotate(
+                            count=Count('pk')
+                        ).values('count')
+                    ), 0)
+                )
+            checked += len(posts)
+            fixed += len(drifted)
+        self.stdout.write(self.style.SUCCESS(
+            f'Проверено публикаций: {checked}, исправлено: {fixed}.'
+        ))
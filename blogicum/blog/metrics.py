@@ -0,0 +1,37 @@
+from django.core.cache import cache
+
+METRIC_KEY = 'blog:metric:{}'
+
+COUNTERS = (
+    'paginator_count.hit',
+    'paginator_count.miss',
+    'page_cache.hit',
+    'page_cache.miss',
+    'post_card.hit',
+    'post_card.miss',
+)
+
+
+def incr(name, delta=1):
+    key = METRIC_KEY.format(name)
+    if not cache.add(key, delta, timeout=None):
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            cache.set(key, delta, timeout=None)
+
+
+def snapshot():
+    values = cache.get_many([METRIC_KEY.format(name) for name in COUNTERS])
+    counters = {
+        name: values.get(METRIC_KEY.format(name), 0) for name in COUNTERS
+    }
+    ratios = {}
+    for name in COUNTERS:
+        prefix, _, kind = name.rpartition('.')
+        if kind == 'hit':
+            total = counters[name] + counters.get(f'{prefix}.miss', 0)
+            ratios[f'{prefix}.hit_ratio'] = (
+                round(counters[name] / total, 4) if total else None
+            )
+    return {'counters': counters, 'ratios': ratios}
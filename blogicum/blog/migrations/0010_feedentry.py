@@ -0,0 +1,64 @@
+# Generated by Django 3.2.16 on 2026-10-17 06:58
+
+from itertools import islice
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_feed_entries(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    FeedEntry = apps.get_model('blog', 'FeedEntry')
+    posts = Post.objects.filter(
+        is_published=True,
+        category__is_published=True
+    ).values_list('pk', 'pub_date', 'category_id', 'author_id')
+    entries = (
+        FeedEntry(feed=feed, scope_id=scope_id, pub_date=pub_date,
+                  post_id=pk)
+        for pk, pub_date, category_id, author_id in posts.iterator()
+        for feed, scope_id in (
+            ('global', 0),
+            ('category', category_id),
+            ('author', author_id),
+        )
+    )
+    while True:
+        batch = list(islice(entries, 1000))
+        if not batch:
+            break
+        FeedEntry.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feed', models.CharField(choices=[('global', 'Общая лента'), ('category', 'Лента категории'), ('author', 'Лента автора')], max_length=16, verbose_name='Лента')),
+                ('scope_id', models.PositiveBigIntegerField(default=0, verbose_name='Категория или автор')),
+                ('pub_date', models.DateTimeField(verbose_name='Дата и время публикации')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to='blog.post', verbose_name='Пост')),
+            ],
+            options={
+                'verbose_name': 'запись ленты',
+                'verbose_name_plural': 'Записи лент',
+                'ordering': ('-pub_date', '-post_id'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='feedentry',
+            index=models.Index(fields=['feed', 'scope_id', '-pub_date', '-post'], name='feed_entry_range_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='feedentry',
+            constraint=models.UniqueConstraint(fields=('post', 'feed'), name='feed_entry_unique_post'),
+        ),
+        migrations.RunPython(fill_feed_entries, migrations.RunPython.noop),
+    ]
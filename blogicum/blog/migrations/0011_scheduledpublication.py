@@ -0,0 +1,42 @@
+# Generated by Django 3.2.16 on 2026-10-17 06:59
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def schedule_future_posts(apps, schema_editor):
+    FeedEntry = apps.get_model('blog', 'FeedEntry')
+    ScheduledPublication = apps.get_model('blog', 'ScheduledPublication')
+    future = FeedEntry.objects.filter(pub_date__gt=timezone.now())
+    ScheduledPublication.objects.bulk_create(
+        ScheduledPublication(post_id=post_id, publish_at=pub_date)
+        for post_id, pub_date in future.filter(
+            feed='global'
+        ).values_list('post_id', 'pub_date')
+    )
+    future.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_feedentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledPublication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('publish_at', models.DateTimeField(db_index=True, verbose_name='Время публикации')),
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='scheduled_publication', to='blog.post', verbose_name='Пост')),
+            ],
+            options={
+                'verbose_name': 'отложенная публикация',
+                'verbose_name_plural': 'Отложенные публикации',
+                'ordering': ('publish_at',),
+            },
+        ),
+        migrations.RunPython(schedule_future_posts, migrations.RunPython.noop),
+    ]
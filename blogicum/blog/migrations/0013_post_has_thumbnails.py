@@ -0,0 +1,56 @@
+# Generated by Django 3.2.16 on 2026-10-17 07:11
+
+from django.db import migrations, models
+
+
+def has_thumbnails_field():
+    field = models.BooleanField(default=False)
+    field.set_attributes_from_name('has_thumbnails')
+    return field
+
+
+# SQLite's AddField rebuilds blog_post, which would drop the search
+# triggers from 0012; a plain ADD COLUMN keeps them and is instant.
+def add_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            'ALTER TABLE blog_post '
+            'ADD COLUMN has_thumbnails bool NOT NULL DEFAULT 0'
+        )
+    else:
+        schema_editor.add_field(
+            apps.get_model('blog', 'Post'), has_thumbnails_field()
+        )
+
+
+def drop_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            'ALTER TABLE blog_post DROP COLUMN has_thumbnails'
+        )
+    else:
+        schema_editor.remove_field(
+            apps.get_model('blog', 'Post'), has_thumbnails_field()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_post_search'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_column, drop_column),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='post',
+                    name='has_thumbnails',
+                    field=models.BooleanField(default=False, editable=False, verbose_name='Превью подготовлены'),
+                ),
+            ],
+        ),
+    ]
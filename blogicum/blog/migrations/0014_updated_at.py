@@ -0,0 +1,73 @@
+# Generated by Django 3.2.16 on 2026-10-17 07:15
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def updated_at_field():
+    field = models.DateTimeField(default=timezone.now)
+    field.set_attributes_from_name('updated_at')
+    return field
+
+
+# See 0013: a table rebuild of blog_post would drop the search triggers.
+def add_post_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            'ALTER TABLE blog_post ADD COLUMN updated_at datetime NOT NULL '
+            "DEFAULT '1970-01-01 00:00:00'"
+        )
+    else:
+        schema_editor.add_field(
+            apps.get_model('blog', 'Post'), updated_at_field()
+        )
+
+
+def drop_post_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('ALTER TABLE blog_post DROP COLUMN updated_at')
+    else:
+        schema_editor.remove_field(
+            apps.get_model('blog', 'Post'), updated_at_field()
+        )
+
+
+def fill_updated_at(apps, schema_editor):
+    for model_name in ('Category', 'Location', 'Post'):
+        apps.get_model('blog', model_name).objects.update(
+            updated_at=F('created_at')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_has_thumbnails'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Изменено'),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Изменено'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_post_column, drop_post_column),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='post',
+                    name='updated_at',
+                    field=models.DateTimeField(auto_now=True, verbose_name='Изменено'),
+                ),
+            ],
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.16 on 2026-10-17 09:02
+
+from django.db import migrations, models
+
+
+def thumbnail_width_field():
+    field = models.PositiveSmallIntegerField(null=True)
+    field.set_attributes_from_name('thumbnail_width')
+    return field
+
+
+# Same as 0013: a plain ADD COLUMN keeps the search triggers on SQLite.
+def add_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            'ALTER TABLE blog_post ADD COLUMN thumbnail_width smallint '
+            'unsigned NULL CHECK ("thumbnail_width" >= 0)'
+        )
+    else:
+        schema_editor.add_field(
+            apps.get_model('blog', 'Post'), thumbnail_width_field()
+        )
+
+
+def drop_column(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            'ALTER TABLE blog_post DROP COLUMN thumbnail_width'
+        )
+    else:
+        schema_editor.remove_field(
+            apps.get_model('blog', 'Post'), thumbnail_width_field()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_updated_at'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_column, drop_column),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='post',
+                    name='thumbnail_width',
+                    field=models.PositiveSmallIntegerField(editable=False, null=True, verbose_name='Ширина крупного превью'),
+                ),
+            ],
+        ),
+    ]
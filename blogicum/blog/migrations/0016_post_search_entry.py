@@ -0,0 +1,30 @@
+# Generated by Django 3.2.16 on 2026-10-17 08:00
+
+import blog.models
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_post_thumbnail_width'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearchEntry',
+            fields=[
+                ('post', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_entry', serialize=False, to='blog.post', verbose_name='Пост')),
+                ('title', models.TextField(verbose_name='Заголовок')),
+                ('text', models.TextField(verbose_name='Текст')),
+                ('document', blog.models.SearchDocumentField(db_column='blog_post_search', editable=False, verbose_name='Документ')),
+            ],
+            options={
+                'verbose_name': 'поисковая запись',
+                'verbose_name_plural': 'Поисковый индекс',
+                'db_table': 'blog_post_search',
+                'managed': False,
+            },
+        ),
+    ]
@@ -1,18 +1,36 @@
-from django.db.models import Count
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import redirect
 from django.views.generic import ListView
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 
-from blog.constants import LIMIT_POST
+from blog import metrics, scheduler
+from blog.cache import (
+    feed_tags, get_cached_page, get_page_validator, get_tag_versions,
+    page_cache_key, page_client, page_etag, page_validator_key,
+    post_ref_tags, set_cached_page, set_page_validator
+)
+from blog.constants import LIMIT_COMMENTS, LIMIT_POST
 from blog.forms import CommentForm
-from blog.models import Comment, Post
+from blog.identity import get_identity_map
+from blog.models import Comment, FeedEntry, Post
+from blog.paginators import CachedCountPaginator, KeysetPaginator
+from blog.read_model import feed_entries
 
 
 class CommentMixin:
     model = Comment
     form_class = CommentForm
     pk_url_kwarg = 'comment_id'
+    scope_url_kwargs = ('post_id',)
     template_name = 'blog/comment.html'
 
     def get_success_url(self):
@@ -22,31 +40,255 @@ class CommentMixin:
         )
 
 
-class PostListMixin(ListView):
+class IdentityMapMixin:
+
+    def get_identity(self, queryset, **lookup):
+        return get_identity_map(self.request).get_or_404(queryset, **lookup)
+
+
+class PageCacheMixin:
+    page_cache_params = ('page', 'after', 'before')
+
+    def has_page_versions(self, request):
+        return (
+            request.method in ('GET', 'HEAD')
+            and set(request.GET) <= set(self.page_cache_params)
+        )
+
+    def is_page_cacheable(self, request):
+        return (
+            settings.BLOG_PAGE_CACHE
+            and not request.user.is_authenticated
+        )
+
+    def get_page_cache_tags(self):
+        return ['pages:all']
+
+    def get_page_cache_object_tags(self, context):
+        return []
+
+    def get_user_page_tags(self):
+        if self.request.user.is_authenticated:
+            return [f'pages:author:{self.request.user.pk}']
+        return []
+
+    def get_not_modified_response(self, validator_key):
+        if not settings.BLOG_CONDITIONAL_GET:
+            return None
+        validator = get_page_validator(validator_key)
+        if validator is None:
+            return None
+        response = get_conditional_response(
+            self.request,
+            etag=validator['etag'],
+            last_modified=validator['last_modified']
+        )
+        if response is not None:
+            response['ETag'] = validator['etag']
+        return response
+
+    def finish_page(self, cache_key, response):
+        if settings.BLOG_CONDITIONAL_GET:
+            etag = page_etag(
+                self.page_cache_versions, page_client(self.request)
+            )
+            last_modified = int(time.time())
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(
+                response,
+                no_cache=True,
+                private=self.request.user.is_authenticated
+            )
+            set_page_validator(
+                page_validator_key(self.request), self.page_cache_versions,
+                etag, last_modified
+            )
+        if cache_key is not None:
+            set_cached_page(
+                cache_key, response, self.page_cache_versions,
+                getattr(self.request, 'preload_static', False)
+            )
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.has_page_versions(request):
+            return super().dispatch(request, *args, **kwargs)
+        scheduler.catch_up()
+        response = self.get_not_modified_response(
+            page_validator_key(request)
+        )
+        if response is not None:
+            return response
+        cache_key = None
+        if self.is_page_cacheable(request):
+            cache_key = page_cache_key(request)
+            response = get_cached_page(cache_key)
+            if response is not None:
+                metrics.incr('page_cache.hit')
+                response['X-Page-Cache'] = 'HIT'
+                return response
+            metrics.incr('page_cache.miss')
+        self.page_cache_versions = get_tag_versions(
+            self.get_page_cache_tags() + self.get_user_page_tags()
+        )
+        response = super().dispatch(request, *args, **kwargs)
+        if cache_key is not None:
+            response['X-Page-Cache'] = 'MISS'
+        if response.status_code == 200 and hasattr(response, 'render'):
+            response.add_post_render_callback(
+                partial(self.finish_page, cache_key)
+            )
+        return response
+
+    def render_to_response(self, context, **response_kwargs):
+        if hasattr(self, 'page_cache_versions'):
+            self.page_cache_versions.update(get_tag_versions(
+                set(self.get_page_cache_object_tags(context))
+                - set(self.page_cache_versions)
+            ))
+        return super().render_to_response(context, **response_kwargs)
+
+
+class PostListMixin(IdentityMapMixin, PageCacheMixin, ListView):
     model = Post
     paginate_by = LIMIT_POST
+    paginator_class = CachedCountPaginator
+    cursor_ordering = ('-pub_date', '-id')
+    feed_entry_ordering = ('-pub_date', '-post_id')
+
+    def get_count_key(self):
+        return 'posts'
+
+    def get_count_tags(self):
+        return feed_tags()
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        return super().get_paginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            count_key=self.get_count_key(),
+            count_tags=self.get_count_tags(),
+            **kwargs
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        after = self.request.GET.get('after')
+        before = self.request.GET.get('before')
+        keyset = KeysetPaginator(
+            queryset,
+            page_size,
+            self.feed_entry_ordering
+            if queryset.model is FeedEntry else self.cursor_ordering
+        )
+        if after is None and before is None:
+            paginator, page, _, is_paginated = super().paginate_queryset(
+                queryset, page_size
+            )
+            page.object_list = list(page.object_list)
+            page.next_cursor = keyset.encode_cursor(
+                page.object_list[-1]
+            ) if page.has_next() else None
+        else:
+            paginator = keyset
+            try:
+                page = paginator.page(after=after, before=before)
+            except InvalidPage as error:
+                raise Http404(str(error))
+            is_paginated = page.has_other_pages()
+        if queryset.model is FeedEntry:
+            page.object_list = [entry.post for entry in page.object_list]
+        return paginator, page, page.object_list, is_paginated
+
+    def get_feed_scope(self):
+        return FeedEntry.GLOBAL, 0
+
+    def get_page_cache_tags(self):
+        return super().get_page_cache_tags() + ['pages:feed']
+
+    def get_page_cache_object_tags(self, context):
+        return [
+            tag for post in context['page_obj'] for tag in post_ref_tags(post)
+        ]
+
+    def get_post_filters(self):
+        return {}
 
     def get_queryset(self):
+        if settings.BLOG_FEED_READ_MODEL:
+            return feed_entries(*self.get_feed_scope())
         return self.get_posts().filter(
             pub_date__lte=timezone.now(),
             is_published=True,
-            category__is_published=True
-        ).annotate(comment_count=Count('comments'))
+            category__is_published=True,
+            **self.get_post_filters()
+        )
 
     def get_posts(self):
         return Post.objects.select_related(
             'category',
             'author',
             'location'
-        ).order_by('-pub_date')
+        ).order_by(*self.cursor_ordering)
+
+
+class PostCommentsMixin(IdentityMapMixin, PageCacheMixin):
+    comment_ordering = ('created_at', 'id')
+
+    def get_page_cache_tags(self):
+        return ['pages:all', f'pages:post:{self.kwargs["post_id"]}']
+
+    def get_page_cache_object_tags(self, context):
+        return post_ref_tags(context['post']) + [
+            f'pages:author:{comment.author_id}'
+            for comment in context['comments']
+        ]
+
+    def get_visible_posts(self):
+        visible = Q(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now()
+        )
+        if self.request.user.is_authenticated:
+            visible |= Q(author=self.request.user)
+        return Post.objects.select_related(
+            'category', 'author', 'location'
+        ).filter(visible)
+
+    def get_comments(self, post, after=None):
+        paginator = KeysetPaginator(
+            post.comments.select_related('author'),
+            LIMIT_COMMENTS,
+            self.comment_ordering
+        )
+        try:
+            return paginator.page(after=after)
+        except InvalidPage as error:
+            raise Http404(str(error))
 
 
 class OwnerMixin:
 
+    def get_object_lookup(self):
+        lookup = {'pk': self.kwargs[self.pk_url_kwarg]}
+        for name in getattr(self, 'scope_url_kwargs', ()):
+            lookup[name] = self.kwargs[name]
+        return lookup
+
     def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != self.request.user:
+        lookup = self.get_object_lookup()
+        try:
+            self.object = self.get_queryset().get(
+                author_id=request.user.pk, **lookup
+            )
+        except self.model.DoesNotExist:
+            if not self.get_queryset().filter(**lookup).exists():
+                raise Http404('Запись не найдена.')
             return redirect(
                 'blog:post_detail',
                 post_id=self.kwargs['post_id']
             )
-        return super().dispatch(request, *args, *kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_object(self, queryset=None):
+        return self.object
@@ -74,12 +74,43 @@ class Post(PubCreateDateModel):
         blank=True,
         upload_to='post_images'
     )
+    has_thumbnails = models.BooleanField(
+        verbose_name='Превью подготовлены',
+        default=False,
+        editable=False
+    )
+    thumbnail_width = models.PositiveSmallIntegerField(
+        verbose_name='Ширина крупного превью',
+        null=True,
+        editable=False
+    )
+    comment_count = models.PositiveIntegerField(
+        verbose_name='Количество комментариев',
+        default=0,
+        editable=False
+    )
 
     class Meta:
         default_related_name = 'posts'
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                name='post_feed_idx',
+                condition=models.Q(is_published=True)
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                name='post_category_feed_idx',
+                condition=models.Q(is_published=True)
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_feed_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title[:LIMIT_WORDS]
@@ -108,7 +139,124 @@ class Comment(models.Model):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         ordering = ('created_at',)
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at', 'id'),
+                name='comment_post_idx'
+            ),
+        )
 
     def __str__(self):
         return (f'Комментарий автора {self.author} '
                 f'к публикации "{self.post}"')
+
+
+class SearchDocumentField(models.TextField):
+    pass
+
+
+@SearchDocumentField.register_lookup
+class Match(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class PostSearchEntry(models.Model):
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        related_name='search_entry',
+        verbose_name='Пост'
+    )
+    title = models.TextField(verbose_name='Заголовок')
+    text = models.TextField(verbose_name='Текст')
+    document = SearchDocumentField(
+        verbose_name='Документ',
+        db_column='blog_post_search',
+        editable=False
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'blog_post_search'
+        verbose_name = 'поисковая запись'
+        verbose_name_plural = 'Поисковый индекс'
+
+    def __str__(self):
+        return str(self.post_id)
+
+
+class FeedEntry(models.Model):
+    GLOBAL = 'global'
+    CATEGORY = 'category'
+    AUTHOR = 'author'
+    FEEDS = (
+        (GLOBAL, 'Общая лента'),
+        (CATEGORY, 'Лента категории'),
+        (AUTHOR, 'Лента автора'),
+    )
+
+    feed = models.CharField(
+        verbose_name='Лента',
+        max_length=16,
+        choices=FEEDS
+    )
+    scope_id = models.PositiveBigIntegerField(
+        verbose_name='Категория или автор',
+        default=0
+    )
+    pub_date = models.DateTimeField(verbose_name='Дата и время публикации')
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='feed_entries',
+        verbose_name='Пост'
+    )
+
+    class Meta:
+        verbose_name = 'запись ленты'
+        verbose_name_plural = 'Записи лент'
+        ordering = ('-pub_date', '-post_id')
+        constraints = (
+            models.UniqueConstraint(
+                fields=('post', 'feed'),
+                name='feed_entry_unique_post'
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=('feed', 'scope_id', '-pub_date', '-post'),
+                name='feed_entry_range_idx'
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.feed}:{self.scope_id} {self.post_id}'
+
+
+class ScheduledPublication(models.Model):
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='scheduled_publication',
+        verbose_name='Пост'
+    )
+    publish_at = models.DateTimeField(
+        verbose_name='Время публикации',
+        db_index=True
+    )
+
+    class Meta:
+        verbose_name = 'отложенная публикация'
+        verbose_name_plural = 'Отложенные публикации'
+        ordering = ('publish_at',)
+
+    def __str__(self):
+        return f'{self.post_id} в {self.publish_at}'
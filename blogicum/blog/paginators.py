@@ -0,0 +1,185 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from blog import metrics
+from blog.cache import get_tag_versions
+
+
+def estimate_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class CachedCountPaginator(Paginator):
+
+    def __init__(self, object_list, per_page, orphans=0,
+                 allow_empty_first_page=True, count_key=None, count_tags=()):
+        super().__init__(object_list, per_page, orphans,
+                         allow_empty_first_page)
+        self.count_key = count_key
+        self.count_tags = tuple(count_tags)
+
+    def _compute_count(self):
+        threshold = settings.BLOG_ESTIMATED_COUNT_THRESHOLD
+        if threshold is not None and hasattr(self.object_list, 'query'):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= threshold:
+                return estimate
+        return super().count
+
+    @cached_property
+    def count(self):
+        if self.count_key is None:
+            return super().count
+        versions = get_tag_versions(self.count_tags)
+        key = 'blog:count:{}:{}'.format(
+            self.count_key,
+            ':'.join(versions[tag] for tag in self.count_tags)
+        )
+        count = cache.get(key)
+        if count is not None:
+            metrics.incr('paginator_count.hit')
+            return count
+        metrics.incr('paginator_count.miss')
+        count = self._compute_count()
+        cache.set(key, count, settings.BLOG_COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(self, object_list, paginator, next_cursor=None,
+                 previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<Keyset page of {len(self.object_list)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+
+    def __init__(self, object_list, per_page, ordering=('-pub_date', '-id')):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.descending = self.ordering[0].startswith('-')
+        self.fields = tuple(field.lstrip('-') for field in self.ordering)
+
+    def _get_value(self, obj, field):
+        if isinstance(obj, dict):
+            return obj[field]
+        return getattr(obj, field)
+
+    def encode_cursor(self, obj):
+        values = [
+            self._get_value(obj, field) for field in self.fields
+        ]
+        raw = json.dumps(
+            [value.isoformat() if hasattr(value, 'isoformat') else value
+             for value in values]
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, ValueError):
+            raise InvalidPage('Неверный курсор страницы.')
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise InvalidPage('Неверный курсор страницы.')
+        opts = self.object_list.model._meta
+        try:
+            values = [
+                opts.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValidationError):
+            raise InvalidPage('Неверный курсор страницы.')
+        if None in values:
+            raise InvalidPage('Неверный курсор страницы.')
+        return values
+
+    def _seek(self, values, forward):
+        lookup = 'lt' if self.descending == forward else 'gt'
+        condition = Q()
+        for index, field in enumerate(self.fields):
+            step = Q(**{f'{field}__{lookup}': values[index]})
+            for prev_field, prev_value in zip(
+                self.fields[:index], values[:index]
+            ):
+                step &= Q(**{prev_field: prev_value})
+            condition |= step
+        return condition
+
+    def _reverse_ordering(self):
+        return tuple(
+            field[1:] if field.startswith('-') else f'-{field}'
+            for field in self.ordering
+        )
+
+    def _page(self, rows, has_next, has_previous):
+        return KeysetPage(
+            rows,
+            self,
+            next_cursor=self.encode_cursor(rows[-1])
+            if rows and has_next else None,
+            previous_cursor=self.encode_cursor(rows[0])
+            if rows and has_previous else None
+        )
+
+    def page(self, after=None, before=None):
+        queryset = self.object_list
+        if before is not None:
+            queryset = queryset.filter(
+                self._seek(self.decode_cursor(before), forward=False)
+            ).order_by(*self._reverse_ordering())
+            rows = list(queryset[:self.per_page + 1])
+            has_previous = len(rows) > self.per_page
+            return self._page(rows[:self.per_page][::-1], True, has_previous)
+        if after is not None:
+            queryset = queryset.filter(
+                self._seek(self.decode_cursor(after), forward=True)
+            )
+        rows = list(queryset.order_by(*self.ordering)[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        return self._page(rows[:self.per_page], has_next, after is not None)
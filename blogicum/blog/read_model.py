@@ -0,0 +1,116 @@
+from django.db import transaction
+from django.utils import timezone
+
+from blog.cache import reset_next_due
+from blog.models import FeedEntry, Post, ScheduledPublication
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def feed_entries(feed, scope_id=0):
+    return FeedEntry.objects.select_related(
+        'post__category',
+        'post__author',
+        'post__location'
+    ).filter(
+        feed=feed,
+        scope_id=scope_id
+    ).order_by('-pub_date', '-post_id')
+
+
+def build_entries(post):
+    return [
+        FeedEntry(feed=feed, scope_id=scope_id, pub_date=post.pub_date,
+                  post_id=post.pk)
+        for feed, scope_id in (
+            (FeedEntry.GLOBAL, 0),
+            (FeedEntry.CATEGORY, post.category_id),
+            (FeedEntry.AUTHOR, post.author_id),
+        )
+    ]
+
+
+def is_visible(post):
+    return (
+        post.is_published
+        and post.category_id is not None
+        and post.category.is_published
+    )
+
+
+def visible_posts():
+    return Post.objects.filter(
+        is_published=True,
+        category__is_published=True
+    ).only('pk', 'pub_date', 'category_id', 'author_id')
+
+
+@transaction.atomic
+def sync_post(post, now=None):
+    now = now or timezone.now()
+    FeedEntry.objects.filter(post_id=post.pk).delete()
+    ScheduledPublication.objects.filter(post_id=post.pk).delete()
+    if not is_visible(post):
+        return
+    if post.pub_date > now:
+        ScheduledPublication.objects.create(
+            post_id=post.pk,
+            publish_at=post.pub_date
+        )
+        reset_next_due()
+    else:
+        FeedEntry.objects.bulk_create(build_entries(post))
+
+
+def _insert_in_batches(posts, batch_size, now):
+    last_pk = 0
+    created = 0
+    while True:
+        batch = list(
+            posts.filter(pk__gt=last_pk).order_by('pk')[:batch_size]
+        )
+        if not batch:
+            return created
+        last_pk = batch[-1].pk
+        FeedEntry.objects.bulk_create(
+            [
+                entry for post in batch if post.pub_date <= now
+                for entry in build_entries(post)
+            ],
+            batch_size=batch_size
+        )
+        ScheduledPublication.objects.bulk_create(
+            [
+                ScheduledPublication(post_id=post.pk, publish_at=post.pub_date)
+                for post in batch if post.pub_date > now
+            ],
+            batch_size=batch_size
+        )
+        created += len(batch)
+
+
+def drop_category(category):
+    FeedEntry.objects.filter(post__category_id=category.pk).delete()
+    ScheduledPublication.objects.filter(
+        post__category_id=category.pk
+    ).delete()
+
+
+@transaction.atomic
+def sync_category(category, batch_size=REBUILD_BATCH_SIZE):
+    drop_category(category)
+    if category.is_published:
+        reset_next_due()
+        _insert_in_batches(
+            visible_posts().filter(category_id=category.pk),
+            batch_size,
+            timezone.now()
+        )
+
+
+@transaction.atomic
+def rebuild(batch_size=REBUILD_BATCH_SIZE):
+    FeedEntry.objects.all().delete()
+    ScheduledPublication.objects.all().delete()
+    reset_next_due()
+    return _insert_in_batches(visible_posts(), batch_size, timezone.now())
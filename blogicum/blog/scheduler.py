@@ -0,0 +1,88 @@
+import math
+import time
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from blog import read_model
+from blog.cache import get_next_due, set_next_due
+from blog.models import ScheduledPublication
+from blog.signals import post_published
+
+PUBLISH_BATCH_SIZE = 100
+
+
+class PublicationScheduler:
+
+    def __init__(self, clock=None, sleep=time.sleep,
+                 batch_size=PUBLISH_BATCH_SIZE):
+        self.clock = clock or timezone.now
+        self.sleep = sleep
+        self.batch_size = batch_size
+
+    def due(self, now):
+        return ScheduledPublication.objects.select_related(
+            'post__category'
+        ).filter(publish_at__lte=now).order_by('publish_at')
+
+    def publish_due(self):
+        now = self.clock()
+        published = 0
+        while True:
+            batch = list(self.due(now)[:self.batch_size])
+            if not batch:
+                return published
+            published += sum(
+                self.publish(scheduled, now) for scheduled in batch
+            )
+
+    @transaction.atomic
+    def publish(self, scheduled, now):
+        claimed, _ = ScheduledPublication.objects.filter(
+            pk=scheduled.pk
+        ).delete()
+        if not claimed:
+            return False
+        read_model.sync_post(scheduled.post, now=now)
+        post_published.send(
+            sender=type(scheduled.post),
+            instance=scheduled.post
+        )
+        return True
+
+    def next_publish_at(self):
+        return ScheduledPublication.objects.aggregate(
+            next=Min('publish_at')
+        )['next']
+
+    def catch_up(self):
+        now = self.clock()
+        next_due = get_next_due()
+        if next_due is not None and next_due > now.timestamp():
+            return 0
+        published = 0
+        publish_at = self.next_publish_at()
+        if publish_at is not None and publish_at <= now:
+            published = self.publish_due()
+            publish_at = self.next_publish_at()
+        set_next_due(publish_at.timestamp() if publish_at else math.inf)
+        return published
+
+    def seconds_until_next(self, max_interval):
+        publish_at = self.next_publish_at()
+        if publish_at is None:
+            return max_interval
+        delay = (publish_at - self.clock()).total_seconds()
+        return min(max(delay, 0), max_interval)
+
+    def run(self, max_interval=60, iterations=None):
+        while iterations is None or iterations > 0:
+            self.publish_due()
+            self.sleep(self.seconds_until_next(max_interval))
+            if iterations is not None:
+                iterations -= 1
+
+
+def catch_up():
+    return PublicationScheduler().catch_up()
@@ -0,0 +1,73 @@
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from blog.models import Post, PostSearchEntry
+
+SEARCH_TABLE = PostSearchEntry._meta.db_table
+REBUILD_BATCH_SIZE = 1000
+MAX_TERMS = 8
+TITLE_WEIGHT = 10.0
+TEXT_WEIGHT = 1.0
+
+
+def is_supported():
+    return connection.vendor == 'sqlite'
+
+
+def search_terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def match_expression(terms):
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def matching_ids(query):
+    return PostSearchEntry.objects.filter(
+        document__match=match_expression(search_terms(query))
+    ).values('post_id')
+
+
+def search_posts(queryset, query):
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+    if not is_supported():
+        for term in terms:
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(text__icontains=term)
+            )
+        return queryset.order_by('-pub_date', '-id')
+    return queryset.filter(
+        search_entry__document__match=match_expression(terms)
+    ).alias(rank=RawSQL(
+        f'bm25({SEARCH_TABLE}, %s, %s)', (TITLE_WEIGHT, TEXT_WEIGHT)
+    )).order_by('rank', '-pub_date', '-id')
+
+
+def rebuild(batch_size=REBUILD_BATCH_SIZE):
+    if not is_supported():
+        return 0
+    indexed = last_pk = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('delete-all')"
+        )
+        while True:
+            rows = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk')
+                .values_list('pk', 'title', 'text')[:batch_size]
+            )
+            if not rows:
+                break
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE}(rowid, title, text) '
+                'VALUES (%s, %s, %s)',
+                rows
+            )
+            last_pk = rows[-1][0]
+            indexed += len(rows)
+    return indexed
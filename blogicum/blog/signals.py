@@ -0,0 +1,163 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save
+)
+from django.dispatch import Signal, receiver
+
+from blog import read_model, thumbnails
+from blog.cache import bump_tags, post_page_tags, post_tags
+from blog.models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+post_published = Signal()
+
+
+def get_post_state(pk):
+    return Post.objects.filter(pk=pk).values(
+        'category_id', 'author_id', 'category__slug', 'author__username',
+        'image'
+    ).first()
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post_state(sender, instance, **kwargs):
+    instance._previous_state = get_post_state(instance.pk)
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_state(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance._previous_state = previous = None
+    if instance.pk is not None:
+        instance._previous_state = previous = get_post_state(instance.pk)
+    instance._image_changed = (
+        not previous or previous['image'] != instance.image.name
+    )
+    if instance._image_changed:
+        instance.has_thumbnails = False
+        instance.thumbnail_width = None
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_published, sender=Post)
+def invalidate_post_caches(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    tags = [f'pages:post:{instance.pk}']
+    for state in (
+        getattr(instance, '_previous_state', None),
+        get_post_state(instance.pk),
+    ):
+        if state:
+            tags += post_tags(state['category_id'], state['author_id'])
+            tags += post_page_tags(
+                state['category__slug'], state['author__username']
+            )
+    bump_tags(*tags)
+
+
+@receiver(post_save, sender=Post)
+def schedule_post_thumbnails(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if instance.image and getattr(instance, '_image_changed', False):
+        thumbnails.schedule(instance)
+
+
+@receiver(post_save, sender=Post)
+def sync_post_feed_entries(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    read_model.sync_post(instance)
+
+
+@receiver(pre_save, sender=Category)
+def remember_category_state(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance._previous_state = None
+    if instance.pk is not None:
+        instance._previous_state = Category.objects.filter(
+            pk=instance.pk
+        ).values('is_published', 'slug').first()
+
+
+@receiver(post_save, sender=Category)
+def sync_category_feed_entries(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_state', None)
+    if previous and previous['is_published'] != instance.is_published:
+        read_model.sync_category(instance)
+
+
+@receiver(pre_delete, sender=Category)
+def drop_category_feed_entries(sender, instance, **kwargs):
+    read_model.drop_category(instance)
+
+
+@receiver(post_save, sender=Category)
+def invalidate_category_caches(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    tags = ['categories', f'pages:category:{instance.pk}']
+    previous = getattr(instance, '_previous_state', None)
+    if previous and previous != {
+        'is_published': instance.is_published,
+        'slug': instance.slug,
+    }:
+        tags.append('pages:all')
+    bump_tags(*tags)
+
+
+@receiver(post_delete, sender=Category)
+def invalidate_deleted_category_caches(sender, instance, **kwargs):
+    bump_tags('categories', 'pages:all')
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location_pages(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_tags(f'pages:location:{instance.pk}')
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_pages(
+    sender, instance, update_fields=None, raw=False, **kwargs
+):
+    if raw:
+        return
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    bump_tags(f'pages:author:{instance.pk}')
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_pages(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_tags(f'pages:post:{instance.post_id}')
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
@@ -0,0 +1,85 @@
+from hashlib import md5
+
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from blog import metrics, thumbnails
+from blog.cache import get_tag_versions, post_ref_tags
+from blog.constants import PAGES_ON_EACH_SIDE, PAGES_ON_ENDS
+
+register = template.Library()
+
+CARD_KEY = 'blog:card:{}:{}'
+IMAGE_SIZES = '(max-width: 40rem) 100vw, 40rem'
+
+
+@register.simple_tag
+def elided_page_range(page_obj):
+    return page_obj.paginator.get_elided_page_range(
+        page_obj.number,
+        on_each_side=PAGES_ON_EACH_SIDE,
+        on_ends=PAGES_ON_ENDS
+    )
+
+
+@register.simple_tag(takes_context=True)
+def page_query(context, **params):
+    query = context['request'].GET.copy()
+    for name in ('page', 'after', 'before'):
+        query.pop(name, None)
+    for name, value in params.items():
+        query[name] = value
+    return query.urlencode()
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post, lazy=False):
+    context = {
+        'post': post, 'sizes': IMAGE_SIZES, 'sources': [], 'lazy': lazy
+    }
+    if not post.has_thumbnails:
+        return context
+    srcsets = {}
+    for width, _, _, content_type, name in thumbnails.derivatives(
+        post.image.name, post.thumbnail_width
+    ):
+        srcsets.setdefault(content_type, []).append(
+            f'{default_storage.url(name)} {width}w'
+        )
+    context['sources'] = [
+        {'type': content_type, 'srcset': ', '.join(srcset)}
+        for content_type, srcset in srcsets.items()
+    ]
+    return context
+
+
+@register.simple_tag
+def post_cards(posts):
+    posts = list(posts)
+    tags = {post.pk: post_ref_tags(post) for post in posts}
+    versions = get_tag_versions(
+        {tag for post_tags in tags.values() for tag in post_tags}
+    )
+    keys = {
+        post.pk: CARD_KEY.format(post.pk, md5(':'.join(
+            versions[tag] for tag in tags[post.pk]
+        ).encode()).hexdigest())
+        for post in posts
+    }
+    cards = cache.get_many(keys.values())
+    missed = {}
+    for post in posts:
+        if keys[post.pk] not in cards:
+            missed[keys[post.pk]] = render_to_string(
+                'includes/post_card.html', {'post': post}
+            )
+    if missed:
+        cache.set_many(missed, settings.BLOG_POST_CARD_CACHE_TIMEOUT)
+        cards.update(missed)
+    metrics.incr('post_card.hit', len(posts) - len(missed))
+    metrics.incr('post_card.miss', len(missed))
+    return [mark_safe(cards[keys[post.pk]]) for post in posts]
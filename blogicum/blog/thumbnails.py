@@ -0,0 +1,125 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps
+
+from blog.cache import bump_tags
+from blog.models import Post
+
+logger = logging.getLogger(__name__)
+
+FORMATS = (
+    ('webp', 'WEBP', 'image/webp'),
+    ('jpg', 'JPEG', 'image/jpeg'),
+)
+QUALITY = 80
+EXIF_ORIENTATION = 0x0112
+ROTATED_ORIENTATIONS = (5, 6, 7, 8)
+
+_executor = None
+
+
+def derivative_name(name, width, extension):
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, 'thumbs', f'{stem}-{width}.{extension}')
+
+
+def thumbnail_widths(source_width=None):
+    widths = sorted(settings.BLOG_THUMBNAIL_WIDTHS)
+    if source_width is None:
+        return widths
+    return [width for width in widths if width < source_width] + [
+        min(source_width, widths[-1])
+    ]
+
+
+def derivatives(name, largest_width=None):
+    return [
+        (width, extension, pil_format, content_type,
+         derivative_name(name, width, extension))
+        for extension, pil_format, content_type in FORMATS
+        for width in thumbnail_widths(largest_width)
+    ]
+
+
+def get_source_width(source):
+    with Image.open(source) as image:
+        width, height = image.size
+        orientation = image.getexif().get(EXIF_ORIENTATION)
+    return height if orientation in ROTATED_ORIENTATIONS else width
+
+
+def render(source, targets):
+    with Image.open(source) as original:
+        width = max(width for width, *_ in targets)
+        original.draft(
+            'RGB', (width, original.height * width // original.width)
+        )
+        image = ImageOps.exif_transpose(original).convert('RGB')
+    for width, pil_format, target in sorted(targets, reverse=True):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        copy = image.copy()
+        copy.thumbnail((width, 1 << 16), Image.LANCZOS)
+        copy.save(target, pil_format, quality=QUALITY)
+
+
+def mark_ready(pk, name, largest_width):
+    if Post.objects.filter(pk=pk, image=name).update(
+        has_thumbnails=True, thumbnail_width=largest_width
+    ):
+        bump_tags(f'pages:post:{pk}')
+
+
+def _finish(pk, name, largest_width, future):
+    try:
+        future.result()
+    except Exception:
+        logger.exception('Не удалось подготовить превью для %s', name)
+        return
+    try:
+        mark_ready(pk, name, largest_width)
+    finally:
+        close_old_connections()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.BLOG_THUMBNAIL_WORKERS
+        )
+    return _executor
+
+
+def generate(pk, name):
+    source = default_storage.path(name)
+    largest_width = thumbnail_widths(get_source_width(source))[-1]
+    targets = [
+        (width, pil_format, default_storage.path(target))
+        for width, _, pil_format, _, target in derivatives(
+            name, largest_width
+        )
+    ]
+    if not settings.BLOG_THUMBNAIL_WORKERS:
+        render(source, targets)
+        mark_ready(pk, name, largest_width)
+        return
+    future = get_executor().submit(render, source, targets)
+    future.add_done_callback(partial(_finish, pk, name, largest_width))
+
+
+def wait():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def schedule(post):
+    transaction.on_commit(partial(generate, post.pk, post.image.name))
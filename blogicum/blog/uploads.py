@@ -0,0 +1,82 @@
+from io import BytesIO
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from PIL import Image
+
+
+class OversizedUploadedFile(UploadedFile):
+    oversized = True
+
+    def __init__(self, name, content_type, size, charset):
+        super().__init__(BytesIO(), name, content_type, size, charset)
+
+
+class SizeLimitedUploadHandler(FileUploadHandler):
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+        self.oversized = False
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.oversized:
+            return None
+        self.received += len(raw_data)
+        if self.received > settings.BLOG_MAX_UPLOAD_SIZE:
+            self.oversized = True
+            return None
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.oversized:
+            return OversizedUploadedFile(
+                self.file_name, self.content_type, self.received,
+                self.charset
+            )
+        return None
+
+
+class HeaderCheckedImageField(forms.ImageField):
+    default_error_messages = {
+        'file_too_large': 'Размер файла не должен превышать %(limit)s МБ.',
+        'too_many_pixels': (
+            'Изображение не должно быть больше %(limit)s мегапикселей.'
+        ),
+    }
+
+    def to_python(self, data):
+        if getattr(data, 'oversized', False):
+            raise ValidationError(
+                self.error_messages['file_too_large'],
+                code='file_too_large',
+                params={'limit': settings.BLOG_MAX_UPLOAD_SIZE // 2 ** 20}
+            )
+        upload = forms.FileField.to_python(self, data)
+        if upload is None:
+            return None
+        if hasattr(data, 'temporary_file_path'):
+            source = data.temporary_file_path()
+        else:
+            source = data
+        try:
+            with Image.open(source) as image:
+                width, height = image.size
+                image_format = image.format
+        except (Image.DecompressionBombError, OSError, ValueError) as error:
+            raise ValidationError(
+                self.error_messages['invalid_image'],
+                code='invalid_image'
+            ) from error
+        if width * height > settings.BLOG_MAX_IMAGE_PIXELS:
+            raise ValidationError(
+                self.error_messages['too_many_pixels'],
+                code='too_many_pixels',
+                params={'limit': settings.BLOG_MAX_IMAGE_PIXELS // 10 ** 6}
+            )
+        upload.content_type = Image.MIME.get(image_format)
+        upload.seek(0)
+        return upload
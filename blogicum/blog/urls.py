@@ -1,6 +1,6 @@
 from django.urls import include, path
 
-from blog import views
+from blog import feeds, views
 
 app_name = 'blog'
 
@@ -21,6 +21,10 @@ posts_urls = [
         '<int:post_id>/delete/',
         views.PostDeleteView.as_view(),
         name='delete_post'),
+    path(
+        '<int:post_id>/comments/',
+        views.CommentListView.as_view(),
+        name='comments'),
     path(
         '<int:post_id>/comment/',
         views.CommentCreateView.as_view(),
@@ -47,6 +51,36 @@ urlpatterns = [
         views.CategoriesListView.as_view(),
         name='category_posts'
     ),
+    path(
+        'feed/rss/',
+        feeds.PostFeed(),
+        name='feed_rss'
+    ),
+    path(
+        'feed/atom/',
+        feeds.AtomPostFeed(),
+        name='feed_atom'
+    ),
+    path(
+        'category/<slug:category_slug>/rss/',
+        feeds.CategoryPostFeed(),
+        name='category_feed_rss'
+    ),
+    path(
+        'category/<slug:category_slug>/atom/',
+        feeds.AtomCategoryPostFeed(),
+        name='category_feed_atom'
+    ),
+    path(
+        'profile/<str:username>/rss/',
+        feeds.AuthorPostFeed(),
+        name='profile_feed_rss'
+    ),
+    path(
+        'profile/<str:username>/atom/',
+        feeds.AtomAuthorPostFeed(),
+        name='profile_feed_atom'
+    ),
     path(
         'profile/<str:username>/',
         views.ProfileDetailView.as_view(),
@@ -61,4 +95,14 @@ urlpatterns = [
         'posts/',
         include(posts_urls)
     ),
+    path(
+        'search/',
+        views.SearchView.as_view(),
+        name='search'
+    ),
+    path(
+        'metrics/',
+        views.MetricsView.as_view(),
+        name='metrics'
+    ),
 ]
@@ -1,17 +1,24 @@
 from django.contrib.auth import get_user_model
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
 from django.views.generic import (
-    CreateView, DeleteView, DetailView, UpdateView
+    CreateView, DeleteView, DetailView, ListView, TemplateView, UpdateView,
+    View
 )
 from django.views.generic.list import MultipleObjectMixin
 
+from blog import metrics
+from blog.cache import feed_tags
+from blog.constants import LIMIT_POST
 from blog.forms import CommentForm, PostForm, UserForm
-from blog.mixins import CommentMixin, OwnerMixin, PostListMixin
-from blog.models import Category, Comment, Post
+from blog.mixins import (
+    CommentMixin, OwnerMixin, PostCommentsMixin, PostListMixin
+)
+from blog.models import Category, Comment, FeedEntry, Post
+from blog.search import search_posts
 
 
 User = get_user_model()
@@ -24,51 +31,86 @@ class PostsListView(PostListMixin):
 class CategoriesListView(PostListMixin, MultipleObjectMixin):
     template_name = 'blog/category.html'
 
-    def get_context_data(self, *, object_list=None, **kwargs):
-        object_list = self.get_queryset()
-        context = super().get_context_data(object_list=object_list, **kwargs)
-        context['category'] = get_object_or_404(
-            Category,
-            slug=self.kwargs['category_slug'],
-            is_published=True
-        )
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['category'] = self.category
         return context
 
     def get_queryset(self):
-        category = get_object_or_404(
+        self.category = self.get_identity(
             Category,
             slug=self.kwargs['category_slug']
         )
-        return super().get_queryset().filter(
-            category=category
-        )
+        if not self.category.is_published:
+            raise Http404('Категория снята с публикации.')
+        return super().get_queryset()
+
+    def get_feed_scope(self):
+        return FeedEntry.CATEGORY, self.category.pk
+
+    def get_page_cache_tags(self):
+        return [
+            'pages:all',
+            f'pages:category-feed:{self.kwargs["category_slug"]}',
+        ]
+
+    def get_page_cache_object_tags(self, context):
+        return super().get_page_cache_object_tags(context) + [
+            f'pages:category:{context["category"].pk}'
+        ]
+
+    def get_post_filters(self):
+        return {'category': self.category}
+
+    def get_count_key(self):
+        return f'posts:category:{self.category.pk}'
+
+    def get_count_tags(self):
+        return feed_tags(category_id=self.category.pk)
 
 
 class ProfileDetailView(PostListMixin, MultipleObjectMixin):
     template_name = 'blog/profile.html'
 
     def get_queryset(self):
-        user = get_object_or_404(User, username=self.kwargs['username'])
-        if user.username == str(self.request.user):
-            posts = self.get_posts().filter(
-                author=user
-            )
-        else:
-            posts = super().get_queryset().filter(
-                author=user
-            )
-        return posts
-
-    def get_context_data(self, *, object_list=None, **kwargs):
-        object_list = self.get_queryset()
-        context = super().get_context_data(
-            object_list=object_list,
-            **kwargs
-        )
-        context['profile'] = get_object_or_404(
+        self.author = user = self.get_identity(
             User,
             username=self.kwargs['username']
         )
+        self.is_owner = user.username == str(self.request.user)
+        if self.is_owner:
+            return self.get_posts().filter(
+                author=user
+            )
+        return super().get_queryset()
+
+    def get_feed_scope(self):
+        return FeedEntry.AUTHOR, self.author.pk
+
+    def get_page_cache_tags(self):
+        return [
+            'pages:all',
+            f'pages:author-feed:{self.kwargs["username"]}',
+        ]
+
+    def get_page_cache_object_tags(self, context):
+        return super().get_page_cache_object_tags(context) + [
+            f'pages:author:{context["profile"].pk}'
+        ]
+
+    def get_post_filters(self):
+        return {'author': self.author}
+
+    def get_count_key(self):
+        key = f'posts:author:{self.author.pk}'
+        return f'{key}:all' if self.is_owner else key
+
+    def get_count_tags(self):
+        return feed_tags(author_id=self.author.pk)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['profile'] = self.author
         return context
 
 
@@ -86,28 +128,39 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         )
 
 
-class PostDetailView(DetailView):
+class PostDetailView(PostCommentsMixin, DetailView):
     model = Post
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
+    def get_queryset(self):
+        return self.get_visible_posts()
+
+    def get_object(self, queryset=None):
+        return self.get_identity(
+            self.get_queryset() if queryset is None else queryset,
+            pk=self.kwargs[self.pk_url_kwarg]
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        post = get_object_or_404(
-            Post.objects.select_related('category', 'author'),
-            Q(pk=self.kwargs['post_id']),
-            Q(author__username=self.request.user) | Q(
-                Q(
-                    is_published=True
-                ) & Q(
-                    category__is_published=True
-                ) & Q(
-                    pub_date__lte=timezone.now()
-                )
-            )
-        )
         context['form'] = CommentForm()
-        context['comments'] = post.comments.select_related('author')
+        context['comments'] = self.get_comments(self.object)
+        return context
+
+
+class CommentListView(PostCommentsMixin, TemplateView):
+    template_name = 'includes/comment_list.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['post'] = post = self.get_identity(
+            self.get_visible_posts(),
+            pk=self.kwargs['post_id']
+        )
+        context['comments'] = self.get_comments(
+            post, after=self.request.GET.get('after')
+        )
         return context
 
 
@@ -192,3 +245,35 @@ class CommentDeleteView(
     DeleteView
 ):
     pass
+
+
+class SearchView(ListView):
+    template_name = 'blog/search.html'
+    paginate_by = LIMIT_POST
+
+    def get_queryset(self):
+        self.query = self.request.GET.get('q', '').strip()
+        return search_posts(
+            Post.objects.select_related(
+                'category', 'author', 'location'
+            ).filter(
+                pub_date__lte=timezone.now(),
+                is_published=True,
+                category__is_published=True
+            ),
+            self.query
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.query
+        return context
+
+
+class MetricsView(UserPassesTestMixin, View):
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(metrics.snapshot())
@@ -1,4 +1,5 @@
 from pathlib import Path
+from tempfile import gettempdir
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -22,11 +23,14 @@ INSTALLED_APPS = [
     'blog.apps.BlogConfig',
     'pages.apps.PagesConfig',
     'core.apps.CoreConfig',
+    'api.apps.ApiConfig',
     'django_bootstrap5',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.StaticFilesMiddleware',
+    'core.middleware.PreloadLinkMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -35,15 +39,29 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+if DEBUG:
+    MIDDLEWARE.append('core.middleware.DuplicateQueryMiddleware')
+
 ROOT_URLCONF = 'blogicum.urls'
 
 TEMPLATES_DIR = BASE_DIR / 'templates'
 
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+if not DEBUG:
+    TEMPLATE_LOADERS = [
+        ('django.template.loaders.cached.Loader', TEMPLATE_LOADERS),
+    ]
+
+TEMPLATES_PRECOMPILE = not DEBUG
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [TEMPLATES_DIR],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -51,6 +69,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': TEMPLATE_LOADERS,
         },
     },
 ]
@@ -65,6 +84,13 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': Path(gettempdir()) / 'blogicum_cache',
+    }
+}
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -99,6 +125,15 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static_dev',
 ]
 
+STATIC_ROOT = BASE_DIR / 'static'
+
+if not DEBUG:
+    STATICFILES_STORAGE = 'core.storage.CompressedManifestStaticFilesStorage'
+
+STATIC_PRELOAD = (
+    ('css/bootstrap.min.css', 'style'),
+)
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
@@ -112,3 +147,51 @@ EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 DATETIME_FORMAT = 'd.m.Y H:i'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'core.warmup': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+        'core.middleware': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+    },
+}
+
+FILE_UPLOAD_HANDLERS = [
+    'blog.uploads.SizeLimitedUploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+BLOG_MAX_UPLOAD_SIZE = 10 * 2 ** 20
+
+BLOG_MAX_IMAGE_PIXELS = 40 * 10 ** 6
+
+BLOG_THUMBNAIL_WIDTHS = (320, 640, 1280)
+
+BLOG_THUMBNAIL_WORKERS = 2
+
+BLOG_COUNT_CACHE_TIMEOUT = 60 * 60
+
+BLOG_ESTIMATED_COUNT_THRESHOLD = None
+
+BLOG_FEED_READ_MODEL = False
+
+BLOG_PAGE_CACHE = True
+
+BLOG_CONDITIONAL_GET = True
+
+BLOG_PAGE_CACHE_TIMEOUT = 60 * 15
+
+BLOG_POST_CARD_CACHE_TIMEOUT = 60 * 60 * 24
@@ -22,6 +22,7 @@ urlpatterns = [
         name='registration'
     ),
     path('pages/', include('pages.urls', namespace='pages')),
+    path('api/', include('api.urls', namespace='api')),
     path('', include('blog.urls', namespace='blog')),
 ]
 
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from core.warmup import precompile_templates
+
+
+class Command(BaseCommand):
+    help = 'Компилирует все шаблоны проекта и выводит время компиляции.'
+
+    def handle(self, *args, **options):
+        timings = precompile_templates()
+        for name, elapsed in sorted(timings, key=lambda item: -item[1]):
+            self.stdout.write(f'{elapsed * 1000:8.2f} мс  {name}')
+        total = sum(elapsed for _, elapsed in timings)
+        self.stdout.write(self.style.SUCCESS(
+            f'Скомпилировано шаблонов: {len(timings)} '
+            f'за {total * 1000:.2f} мс.'
+        ))
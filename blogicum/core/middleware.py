@@ -0,0 +1,123 @@
+import logging
+import mimetypes
+import os
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.db import connection
+from django.http import FileResponse
+from django.templatetags.static import static
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+
+logger = logging.getLogger(__name__)
+
+
+class DuplicateQueryMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DEBUG:
+            return self.get_response(request)
+        start = len(connection.queries)
+        response = self.get_response(request)
+        counts = Counter(
+            query['sql'] for query in connection.queries[start:]
+        )
+        duplicates = sum(count - 1 for count in counts.values())
+        response['X-Duplicate-Queries'] = str(duplicates)
+        if duplicates:
+            logger.warning(
+                '%s: %d повторных SQL-запросов из %d',
+                request.path, duplicates, sum(counts.values())
+            )
+            for sql, count in counts.most_common():
+                if count < 2:
+                    break
+                logger.warning('x%d %s', count, sql)
+        return response
+
+
+class StaticFilesMiddleware:
+    encodings = (('br', '.br'), ('gzip', '.gz'))
+    immutable_cache_control = 'public, max-age=31536000, immutable'
+    revalidate_cache_control = 'public, max-age=60'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.root = settings.STATIC_ROOT
+        self.prefix = settings.STATIC_URL
+        self.hashed_files = set(
+            getattr(staticfiles_storage, 'hashed_files', {}).values()
+        )
+
+    def __call__(self, request):
+        if (
+            self.root
+            and request.method in ('GET', 'HEAD')
+            and request.path.startswith(self.prefix)
+        ):
+            response = self.serve(request, request.path[len(self.prefix):])
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    def serve(self, request, name):
+        try:
+            path = safe_join(self.root, name)
+        except SuspiciousFileOperation:
+            return None
+        if not os.path.isfile(path):
+            return None
+        content_type = mimetypes.guess_type(path)[0]
+        accepted = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        encoding = None
+        for candidate, suffix in self.encodings:
+            if candidate in accepted and os.path.isfile(path + suffix):
+                path, encoding = path + suffix, candidate
+                break
+        response = FileResponse(
+            open(path, 'rb'),
+            content_type=content_type or 'application/octet-stream',
+            filename=os.path.basename(name)
+        )
+        if encoding:
+            response['Content-Encoding'] = encoding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        response['Cache-Control'] = (
+            self.immutable_cache_control if name in self.hashed_files
+            else self.revalidate_cache_control
+        )
+        return response
+
+
+class PreloadLinkMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def should_preload(self, request, response):
+        return (
+            response.status_code == 200
+            and response.get('Content-Type', '').startswith('text/html')
+            and (
+                getattr(request, 'preload_static', False)
+                or getattr(response, 'preload_static', False)
+            )
+        )
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if self.should_preload(request, response):
+            links = [
+                f'<{static(name)}>; rel=preload; as={kind}'
+                for name, kind in settings.STATIC_PRELOAD
+            ]
+            if response.has_header('Link'):
+                links.insert(0, response['Link'])
+            response['Link'] = ', '.join(links)
+        return response
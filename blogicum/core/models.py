@@ -11,6 +11,10 @@ class PubCreateDateModel(models.Model):
         verbose_name='Добавлено',
         auto_now_add=True
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Изменено',
+        auto_now=True
+    )
 
     class Meta:
         abstract = True
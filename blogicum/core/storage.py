@@ -0,0 +1,39 @@
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    compressible_extensions = (
+        '.css', '.js', '.svg', '.ico', '.json', '.map', '.txt', '.xml'
+    )
+    min_compress_size = 256
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for name in {*paths, *self.hashed_files.values()}:
+            if name.endswith(self.compressible_extensions):
+                self.compress(self.path(name))
+
+    def compress(self, path):
+        if not os.path.isfile(path):
+            return
+        with open(path, 'rb') as source:
+            data = source.read()
+        if len(data) < self.min_compress_size:
+            return
+        variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(data)))
+        for suffix, compressed in variants:
+            if len(compressed) < len(data):
+                with open(path + suffix, 'wb') as target:
+                    target.write(compressed)
@@ -0,0 +1,11 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def preload_static(context):
+    request = context.get('request')
+    if request is not None:
+        request.preload_static = True
+    return ''
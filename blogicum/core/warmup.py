@@ -0,0 +1,42 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = ('.html', '.txt')
+
+
+def iter_template_names(directory):
+    for path in sorted(directory.rglob('*')):
+        if path.is_file() and path.suffix in TEMPLATE_SUFFIXES:
+            yield path.relative_to(directory).as_posix()
+
+
+def precompile_templates():
+    timings = []
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for name in iter_template_names(settings.TEMPLATES_DIR):
+            started = time.perf_counter()
+            try:
+                engine.get_template(name)
+            except TemplateSyntaxError as error:
+                raise ImproperlyConfigured(
+                    f'Шаблон {name} не компилируется: {error}'
+                ) from error
+            elapsed = time.perf_counter() - started
+            logger.info('Шаблон %s скомпилирован за %.2f мс',
+                        name, elapsed * 1000)
+            timings.append((name, elapsed))
+    return timings
+
+
+def warm_up():
+    if settings.TEMPLATES_PRECOMPILE:
+        precompile_templates()
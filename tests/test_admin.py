@@ -0,0 +1,100 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _changelist(admin_client, url, params):
+    response = admin_client.get(url, params)
+    assert response.status_code == 200
+    return list(response.context['cl'].result_list)
+
+
+def test_post_admin_search_and_filters(
+    mixer, admin_client, user, published_category
+):
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        title='Котики на крыше'
+    )
+    mixer.blend('blog.Post', author=user, title='Заметка')
+    url = '/admin/blog/post/'
+    assert _changelist(admin_client, url, {'q': 'котики'}) == [post], (
+        'Убедитесь, что поиск в админке публикаций использует '
+        'полнотекстовый индекс.'
+    )
+    assert _changelist(
+        admin_client, url, {'category': published_category.slug}
+    ) == [post], 'Убедитесь, что работает фильтр по слагу категории.'
+    assert len(_changelist(
+        admin_client, url, {'author': user.username}
+    )) == 2, 'Убедитесь, что работает фильтр по имени автора.'
+
+
+def test_comment_admin_query_count(mixer, admin_client):
+    url = '/admin/blog/comment/'
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            assert admin_client.get(url).status_code == 200
+        return len(context.captured_queries)
+
+    mixer.blend('blog.Comment')
+    baseline = count_queries()
+    mixer.cycle(10).blend('blog.Comment')
+    assert count_queries() == baseline, (
+        'Убедитесь, что список комментариев в админке не делает '
+        'отдельных запросов на каждого автора или публикацию.'
+    )
+
+
+@pytest.mark.parametrize('field', ['category', 'location'])
+def test_related_posts_panel(
+    mixer, admin_client, field, published_category, published_location
+):
+    owner = {
+        'category': published_category, 'location': published_location
+    }[field]
+    change_url = f'/admin/blog/{field}/{owner.pk}/change/'
+    panel_url = f'/admin/blog/{field}/{owner.pk}/posts/'
+    mixer.cycle(25).blend('blog.Post', **{field: owner})
+    response = admin_client.get(change_url)
+    assert response.status_code == 200
+    assert 'inline_admin_formsets' not in response.context or not (
+        response.context['inline_admin_formsets']
+    ), 'Убедитесь, что публикации не выводятся в форме как инлайны.'
+    assert panel_url in response.content.decode(), (
+        'Убедитесь, что страница объекта подгружает панель публикаций.'
+    )
+
+    def count_queries(page):
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get(panel_url, {'page': page})
+        assert response.status_code == 200
+        return len(context.captured_queries), response
+
+    queries, response = count_queries(1)
+    assert len(response.context['page_obj']) == 20
+    assert count_queries(2)[0] == queries, (
+        'Убедитесь, что панель публикаций разбита на страницы и делает '
+        'одинаковое число запросов на каждой странице.'
+    )
+
+
+def test_input_filter_keeps_other_params(
+    mixer, admin_client, user, published_category
+):
+    mixer.blend('blog.Post', author=user, category=published_category)
+    params = {'q': 'котики', 'o': '2', 'category': published_category.slug}
+    response = admin_client.get('/admin/blog/post/', params)
+    changelist = response.context['cl']
+    spec = next(
+        spec for spec in changelist.filter_specs
+        if getattr(spec, 'parameter_name', None) == 'author'
+    )
+    all_choice = next(spec.choices(changelist))
+    assert dict(all_choice['query_parts']) == params, (
+        'Убедитесь, что форма фильтра с полем ввода сохраняет '
+        'поисковый запрос и остальные параметры списка.'
+    )
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from blog.cache import get_page_validator, query_validator_key
+
+pytestmark = [pytest.mark.django_db]
+
+
+def read_json(response):
+    if response.streaming:
+        return json.loads(b''.join(response.streaming_content))
+    return json.loads(response.content)
+
+
+def test_api_posts_cursor_pagination(
+    mixer, client, user, published_category
+):
+    posts = mixer.cycle(5).blend(
+        'blog.Post', author=user, category=published_category
+    )
+    hidden = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=False
+    )
+    url = '/api/v1/posts/?limit=2'
+    seen = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200, (
+            'Убедитесь, что список публикаций в API доступен.'
+        )
+        data = read_json(response)
+        assert len(data['results']) <= 2, (
+            'Убедитесь, что API учитывает параметр `limit`.'
+        )
+        seen.extend(item['id'] for item in data['results'])
+        url = data['next']
+    assert sorted(seen) == sorted(post.id for post in posts), (
+        'Убедитесь, что курсорная пагинация API обходит все публикации '
+        'без повторов.'
+    )
+    assert hidden.id not in seen, (
+        'Убедитесь, что в API не попадают скрытые публикации.'
+    )
+
+
+def test_api_fields_selection(
+    client, user, published_category, post_with_published_location
+):
+    post = post_with_published_location
+    data = read_json(client.get('/api/v1/posts/?fields=id,author,location'))
+    assert data['results'] == [{
+        'id': post.id,
+        'author': user.username,
+        'location': post.location.name,
+    }], 'Убедитесь, что API возвращает только поля из параметра `fields`.'
+    response = client.get('/api/v1/posts/?fields=id,password')
+    assert response.status_code == 400, (
+        'Убедитесь, что API отклоняет неизвестные поля ответом 400.'
+    )
+    response = client.get(f'/api/v1/posts/{post.id}/?fields=title')
+    assert read_json(response) == {'title': post.title}
+
+
+def test_api_etag_and_not_found(
+    mixer, client, user, published_category, post_with_published_location
+):
+    post = post_with_published_location
+    url = f'/api/v1/posts/{post.id}/comments/'
+    response = client.get(url)
+    etag = response['ETag']
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304, (
+        'Убедитесь, что API отвечает 304 на неизменённые данные.'
+    )
+    comment = mixer.blend('blog.Comment', post=post, author=user)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        'Убедитесь, что ETag API меняется после нового комментария.'
+    )
+    assert [item['id'] for item in read_json(response)['results']] == [
+        comment.id
+    ]
+    for url in (
+        '/api/v1/posts/0/',
+        '/api/v1/categories/missing/posts/',
+        '/api/v1/profiles/missing/posts/',
+    ):
+        response = client.get(url)
+        assert response.status_code == 404 and 'detail' in read_json(
+            response
+        ), f'Убедитесь, что `{url}` возвращает ошибку 404 в формате JSON.'
+
+
+def test_validator_key_ignores_unknown_params(
+    client, post_with_published_location
+):
+    url = '/api/v1/posts/'
+    client.get(f'{url}?fields=title,%20id&utm=1&limit=5')
+    client.get(f'{url}?x=2&limit=5&fields=id,title')
+    assert get_page_validator(query_validator_key(
+        url, [('fields', 'id,title'), ('limit', '5')]
+    )) is not None, (
+        'Убедитесь, что ключ валидатора API строится только из '
+        'разрешённых параметров в нормализованном виде.'
+    )
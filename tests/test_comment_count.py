@@ -0,0 +1,37 @@
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_comments(
+    mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.post(f'/posts/{post.id}/comment/', data={'text': 'Текст'})
+    comments = mixer.cycle(2).blend('blog.Comment', post=post)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        'Убедитесь, что счётчик комментариев публикации увеличивается '
+        'при добавлении комментария.'
+    )
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        'Убедитесь, что счётчик комментариев публикации уменьшается '
+        'при удалении комментария.'
+    )
+
+
+def test_recount_comments_fixes_drift(
+    mixer, PostModel, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend('blog.Comment', post=post)
+    PostModel.objects.filter(pk=post.pk).update(comment_count=42)
+    call_command('recount_comments', batch_size=1)
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        'Убедитесь, что команда `recount_comments` исправляет '
+        'расхождения счётчика комментариев.'
+    )
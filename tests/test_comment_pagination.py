@@ -0,0 +1,56 @@
+import pytest
+
+from blog.constants import LIMIT_COMMENTS
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comments_are_paginated(
+    mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comments = mixer.cycle(LIMIT_COMMENTS * 2 + 3).blend(
+        'blog.Comment', post=post
+    )
+    expected = [
+        comment.id for comment in sorted(
+            comments, key=lambda comment: (comment.created_at, comment.id)
+        )
+    ]
+    page = user_client.get(f'/posts/{post.id}/').context['comments']
+    assert len(page) == LIMIT_COMMENTS, (
+        'Убедитесь, что на странице публикации выводится только первая '
+        'страница комментариев.'
+    )
+    seen = [comment.id for comment in page]
+    while page.has_next():
+        response = user_client.get(
+            f'/posts/{post.id}/comments/', {'after': page.next_cursor}
+        )
+        assert response.status_code == 200, (
+            'Убедитесь, что следующая страница комментариев '
+            'загружается без ошибок.'
+        )
+        page = response.context['comments']
+        seen.extend(comment.id for comment in page)
+    assert seen == expected, (
+        'Убедитесь, что комментарии подгружаются по порядку создания '
+        'без пропусков и повторов.'
+    )
+
+
+def test_comments_fragment_respects_visibility(
+    client, post_with_published_location
+):
+    post = post_with_published_location
+    response = client.get(f'/posts/{post.id}/comments/', {'after': 'bad'})
+    assert response.status_code == 404, (
+        'Убедитесь, что при неверном курсоре возвращается ошибка 404.'
+    )
+    post.is_published = False
+    post.save()
+    response = client.get(f'/posts/{post.id}/comments/')
+    assert response.status_code == 404, (
+        'Убедитесь, что комментарии к скрытой публикации недоступны '
+        'другим пользователям.'
+    )
@@ -0,0 +1,83 @@
+import pytest
+from django.conf import settings
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.parametrize('client_fixture', ['client', 'user_client'])
+def test_conditional_get(
+    request, client_fixture, mixer, user, published_category,
+    post_with_published_location
+):
+    client = request.getfixturevalue(client_fixture)
+    post = post_with_published_location
+    for url in (
+        '/',
+        f'/category/{published_category.slug}/',
+        f'/profile/{user.username}/',
+        f'/posts/{post.id}/',
+    ):
+        response = client.get(url)
+        etag = response['ETag']
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304, (
+            f'Убедитесь, что неизменившаяся страница `{url}` '
+            'отдаётся ответом 304.'
+        )
+        assert not response.templates, (
+            'Убедитесь, что при ответе 304 шаблоны не рендерятся.'
+        )
+    mixer.blend('blog.Comment', post=post)
+    response = client.get(f'/posts/{post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200 and response['ETag'] != etag, (
+        'Убедитесь, что новый комментарий меняет ETag страницы публикации.'
+    )
+
+
+def test_etag_depends_on_user(
+    client, user_client, another_user_client, post_with_published_location
+):
+    url = f'/posts/{post_with_published_location.id}/'
+    etags = {
+        c.get(url)['ETag'] for c in (client, user_client, another_user_client)
+    }
+    assert len(etags) == 3, (
+        'Убедитесь, что ETag учитывает текущего пользователя.'
+    )
+    response = another_user_client.get(
+        url, HTTP_IF_NONE_MATCH=user_client.get(url)['ETag']
+    )
+    assert response.status_code == 200
+
+
+def test_etag_changes_after_login(
+    client, user, post_with_published_location
+):
+    user.set_password('password')
+    user.save()
+    url = f'/posts/{post_with_published_location.id}/'
+    credentials = {'username': user.username, 'password': 'password'}
+    client.post('/auth/login/', credentials)
+    etag = client.get(url)['ETag']
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    client.post('/auth/login/', credentials)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        'Убедитесь, что после повторного входа страница с формой '
+        'отдаётся заново, с новым CSRF-токеном.'
+    )
+    etag = response['ETag']
+    del client.cookies[settings.CSRF_COOKIE_NAME]
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        'Убедитесь, что ETag страницы зависит от CSRF-токена.'
+    )
+
+def test_updated_at_tracks_changes(mixer, post_with_published_location):
+    post = post_with_published_location
+    updated_at = post.updated_at
+    post.title = 'Новый заголовок'
+    post.save()
+    assert post.updated_at > updated_at, (
+        'Убедитесь, что поле `updated_at` обновляется при сохранении.'
+    )
@@ -0,0 +1,25 @@
+import pytest
+
+from blog import metrics
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_feed_count_is_cached_and_invalidated(
+    mixer, user, user_client, published_category,
+    many_posts_with_published_locations
+):
+    url = f'/category/{published_category.slug}/'
+    first = user_client.get(url).context['paginator'].count
+    second = user_client.get(url).context['paginator'].count
+    counters = metrics.snapshot()['counters']
+    assert first == second == len(many_posts_with_published_locations)
+    assert counters['paginator_count.hit'] == 1, (
+        'Убедитесь, что число публикаций в ленте берётся из кеша '
+        'при повторном запросе.'
+    )
+    mixer.blend('blog.Post', author=user, category=published_category)
+    assert user_client.get(url).context['paginator'].count == first + 1, (
+        'Убедитесь, что кеш числа публикаций сбрасывается при '
+        'добавлении публикации.'
+    )
@@ -0,0 +1,60 @@
+import csv
+import gzip
+import json
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_export_blog_jsonl_gzip_with_checkpoint(
+    mixer, tmp_path, user, published_category, published_location
+):
+    posts = mixer.cycle(3).blend(
+        'blog.Post', author=user, category=published_category,
+        location=published_location
+    )
+    path = tmp_path / 'posts.jsonl.gz'
+    checkpoint = tmp_path / 'posts.pk'
+    call_command(
+        'export_blog', 'posts', str(path), checkpoint=str(checkpoint),
+        chunk_size=2
+    )
+    last_pk, offset = map(int, checkpoint.read_text().split())
+    assert last_pk == posts[-1].pk and offset == path.stat().st_size, (
+        'Убедитесь, что выгрузка сохраняет последний pk и размер файла.'
+    )
+    with open(path, 'ab') as stream:
+        stream.write(b'\x1f\x8b broken tail of an interrupted run')
+    post = mixer.blend('blog.Post', author=user, category=published_category)
+    call_command(
+        'export_blog', 'posts', str(path), checkpoint=str(checkpoint)
+    )
+    with gzip.open(path, 'rt', encoding='utf-8') as stream:
+        rows = [json.loads(line) for line in stream]
+    assert [row['id'] for row in rows] == [
+        item.pk for item in posts + [post]
+    ], 'Убедитесь, что выгрузка продолжается с контрольной точки.'
+    assert rows[0]['category'] == published_category.slug
+    assert rows[0]['author'] == user.username
+    assert rows[0]['location'] == published_location.name
+
+
+def test_export_blog_comments_csv(
+    mixer, tmp_path, user, post_with_published_location
+):
+    comment = mixer.blend(
+        'blog.Comment', post=post_with_published_location, author=user
+    )
+    path = tmp_path / 'comments.csv'
+    call_command('export_blog', 'comments', str(path))
+    with open(path, encoding='utf-8', newline='') as stream:
+        rows = list(csv.DictReader(stream))
+    assert rows == [{
+        'id': str(comment.pk),
+        'post': str(comment.post_id),
+        'author': comment.author.username,
+        'text': comment.text,
+        'created_at': comment.created_at.isoformat(),
+    }], 'Убедитесь, что комментарии выгружаются в CSV.'
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _feed_ids(client, url):
+    return [post.id for post in client.get(url).context['page_obj']]
+
+
+def _feed_urls(user, category):
+    return (
+        '/',
+        f'/category/{category.slug}/',
+        f'/profile/{user.username}/',
+    )
+
+
+def test_read_model_matches_live_feeds(
+    settings, mixer, user, another_user_client, published_category,
+    many_posts_with_published_locations
+):
+    mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        pub_date=timezone.now() + timedelta(days=1)
+    )
+    mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=False
+    )
+    urls = _feed_urls(user, published_category)
+    live = [_feed_ids(another_user_client, url) for url in urls]
+    settings.BLOG_FEED_READ_MODEL = True
+    assert [_feed_ids(another_user_client, url) for url in urls] == live, (
+        'Убедитесь, что ленты из таблицы `FeedEntry` совпадают с лентами, '
+        'собранными из публикаций.'
+    )
+    call_command('rebuild_feed', batch_size=7)
+    assert [_feed_ids(another_user_client, url) for url in urls] == live, (
+        'Убедитесь, что команда `rebuild_feed` восстанавливает ленты.'
+    )
+
+
+def test_read_model_follows_changes(
+    settings, mixer, user, another_user_client, published_category,
+    post_with_published_location
+):
+    settings.BLOG_FEED_READ_MODEL = True
+    post = post_with_published_location
+    urls = _feed_urls(user, published_category)
+    assert all(
+        _feed_ids(another_user_client, url) == [post.id] for url in urls
+    )
+
+    post.is_published = False
+    post.save()
+    assert _feed_ids(another_user_client, '/') == [], (
+        'Убедитесь, что снятая с публикации запись исчезает из ленты.'
+    )
+
+    post.is_published = True
+    post.save()
+    published_category.is_published = False
+    published_category.save()
+    assert _feed_ids(another_user_client, '/') == [], (
+        'Убедитесь, что записи скрытой категории исчезают из ленты.'
+    )
+
+    published_category.is_published = True
+    published_category.save()
+    assert _feed_ids(another_user_client, '/') == [post.id]
+
+    post.delete()
+    assert _feed_ids(another_user_client, '/') == []
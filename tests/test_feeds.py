@@ -0,0 +1,90 @@
+import pytest
+from django.test import RequestFactory
+
+from blog.cache import feed_cache_key, get_cached_page, page_cache_key
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_feeds_follow_visibility(
+    mixer, client, user, published_category, another_category,
+    post_with_published_location
+):
+    visible = post_with_published_location
+    hidden = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=False
+    )
+    other = mixer.blend('blog.Post', author=user, category=another_category)
+    for url, expected in (
+        ('/feed/rss/', {visible, other}),
+        ('/feed/atom/', {visible, other}),
+        (f'/category/{published_category.slug}/rss/', {visible}),
+        (f'/profile/{user.username}/atom/', {visible, other}),
+    ):
+        response = client.get(url)
+        assert response.status_code == 200, (
+            f'Убедитесь, что лента `{url}` доступна.'
+        )
+        content = response.content.decode()
+        for post in expected:
+            assert f'/posts/{post.id}/' in content, (
+                f'Убедитесь, что лента `{url}` содержит опубликованные посты.'
+            )
+        assert f'/posts/{hidden.id}/' not in content, (
+            'Убедитесь, что в ленты не попадают скрытые публикации.'
+        )
+
+
+def test_feed_is_cached_and_conditional(
+    mixer, client, user, published_category, post_with_published_location
+):
+    url = f'/category/{published_category.slug}/rss/'
+    response = client.get(url)
+    etag = response['ETag']
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304, (
+        'Убедитесь, что лента без изменений отдаётся ответом 304.'
+    )
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200 and (
+        f'/posts/{post.id}/' in response.content.decode()
+    ), 'Убедитесь, что кеш ленты сбрасывается при новой публикации.'
+    assert client.get('/category/missing/rss/').status_code == 404
+
+
+def test_feed_cache_key_ignores_query_string(
+    client, published_category, post_with_published_location
+):
+    url = f'/category/{published_category.slug}/rss/'
+    for number in range(3):
+        client.get(f'{url}?utm={number}')
+    assert get_cached_page(feed_cache_key(
+        'CategoryPostFeed', 'http', 'testserver', published_category.slug
+    )) is not None, 'Убедитесь, что ключ кеша ленты строится по её виду.'
+    assert get_cached_page(page_cache_key(
+        RequestFactory().get(f'{url}?utm=0')
+    )) is None, (
+        'Убедитесь, что ключ кеша ленты не зависит от строки запроса.'
+    )
+    assert client.get('/feed/atom/')['Content-Type'] != (
+        client.get('/feed/rss/')['Content-Type']
+    ), 'Убедитесь, что ленты RSS и Atom кешируются раздельно.'
+
+
+def test_feed_cache_key_includes_host_and_scheme(
+    client, post_with_published_location
+):
+    post_url = f'/posts/{post_with_published_location.id}/'
+    for host, secure, link in (
+        ('testserver', False, f'http://testserver{post_url}'),
+        ('localhost', True, f'https://localhost{post_url}'),
+    ):
+        response = client.get('/feed/rss/', HTTP_HOST=host, secure=secure)
+        assert link in response.content.decode(), (
+            'Убедитесь, что закешированная лента не отдаёт ссылки '
+            'с чужим хостом или схемой.'
+        )
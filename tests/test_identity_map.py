@@ -0,0 +1,57 @@
+from collections import Counter
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.identity import IdentityMap
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.parametrize('client_fixture', ['user_client', 'unlogged_client'])
+def test_views_do_not_repeat_queries(
+    request, client_fixture, user, published_category,
+    post_with_published_location
+):
+    client = request.getfixturevalue(client_fixture)
+    for url in (
+        f'/category/{published_category.slug}/',
+        f'/profile/{user.username}/',
+        f'/posts/{post_with_published_location.id}/',
+    ):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == 200
+        counts = Counter(query['sql'] for query in context.captured_queries)
+        duplicates = [sql for sql, count in counts.items() if count > 1]
+        assert not duplicates, (
+            f'Убедитесь, что страница `{url}` не выполняет одинаковые '
+            f'SQL-запросы повторно: {duplicates}'
+        )
+
+
+def test_duplicate_queries_header(settings, client, published_category):
+    settings.DEBUG = True
+    settings.MIDDLEWARE = [
+        *settings.MIDDLEWARE, 'core.middleware.DuplicateQueryMiddleware'
+    ]
+    response = client.get(f'/category/{published_category.slug}/')
+    assert response['X-Duplicate-Queries'] == '0', (
+        'Убедитесь, что в режиме отладки в ответ добавляется число '
+        'повторных SQL-запросов.'
+    )
+
+
+def test_identity_map_respects_queryset_filters(mixer, user):
+    post = mixer.blend('blog.Post', author=user, is_published=False)
+    identity_map = IdentityMap()
+    assert identity_map.get(Post, pk=post.pk) == post
+    assert identity_map.get(
+        Post.objects.filter(is_published=True), pk=post.pk
+    ) is None, (
+        'Убедитесь, что карта объектов не отдаёт объект, загруженный '
+        'через другой набор фильтров.'
+    )
+    assert identity_map.get(Post.objects.all(), pk=post.pk) == post
@@ -0,0 +1,91 @@
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from blog import importer
+from blog.models import Comment, FeedEntry, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def make_dump(suffix=''):
+    return [
+        {'model': 'blog.post', 'pk': 1, 'fields': {
+            'created_at': '2022-12-18T23:06:18.993Z', 'is_published': True,
+            'title': f'Обед{suffix}', 'text': 'Текст',
+            'pub_date': '1897-02-13T00:00:00Z', 'author': 1,
+            'category': 1, 'location': None, 'comment_count': 1,
+        }},
+        {'model': 'auth.user', 'pk': 1, 'fields': {
+            'username': f'leo{suffix}', 'password': '!',
+            'date_joined': '2022-12-18T22:57:29.299Z',
+            'groups': [], 'user_permissions': [],
+        }},
+        {'model': 'blog.category', 'pk': 1, 'fields': {
+            'created_at': '2022-12-18T23:03:52.159Z', 'is_published': True,
+            'title': 'День', 'slug': f'routine{suffix}',
+            'description': 'Описание',
+        }},
+        {'model': 'blog.comment', 'pk': 1, 'fields': {
+            'text': 'Комментарий', 'post': 1, 'author': 1,
+            'created_at': '2022-12-19T10:00:00Z',
+        }},
+        {'model': 'sessions.session', 'pk': 'key', 'fields': {}},
+    ]
+
+
+def test_import_blog_streams_json_and_jsonl(tmp_path, capsys):
+    path = tmp_path / 'db.json'
+    path.write_text(json.dumps(make_dump(), ensure_ascii=False, indent=2))
+    call_command('import_blog', str(path), batch_size=2)
+    post = Post.objects.get()
+    assert post.author.username == 'leo' and post.category.slug == 'routine'
+    assert post.created_at.year == 2022 and post.updated_at.year == 2022, (
+        'Убедитесь, что загрузка сохраняет даты из дампа.'
+    )
+    assert post.comment_count == 1 and FeedEntry.objects.filter(
+        post=post
+    ).exists(), (
+        'Убедитесь, что загрузка не удваивает счётчики комментариев и '
+        'пересобирает ленты.'
+    )
+    assert 'Пропущено объектов sessions.session: 1.' in capsys.readouterr().out
+
+    path = tmp_path / 'db.jsonl.gz'
+    with gzip.open(path, 'wt', encoding='utf-8') as stream:
+        for record in make_dump('-2'):
+            stream.write(json.dumps(record) + '\n')
+    call_command(
+        'import_blog', str(path), append=True, no_signals=True,
+        no_constraint_checks=True, batch_size=2
+    )
+    post = Post.objects.get(title='Обед-2')
+    assert post.pk == 2 and post.author.username == 'leo-2', (
+        'Убедитесь, что при --append внешние ключи сдвигаются вместе с id.'
+    )
+    assert post.comment_count == 1 and Comment.objects.get(
+        post=post
+    ).author == post.author
+    assert FeedEntry.objects.filter(post=post).exists(), (
+        'Убедитесь, что без сигналов ленты пересобираются после загрузки.'
+    )
+
+    call_command('import_blog', str(tmp_path / 'db.json'), append=True)
+    post = Post.objects.order_by('pk').last()
+    assert post.pk == 3 and post.author.username == 'leo', (
+        'Убедитесь, что при --append существующие пользователи и категории '
+        'сопоставляются по username и slug.'
+    )
+    assert post.category.slug == 'routine'
+
+
+def test_iter_json_reads_large_objects_in_chunks():
+    text = 'x' * 10000
+    stream = io.StringIO(json.dumps([{'text': text}, {'text': 'y'}]))
+    records = list(importer.iter_json(stream, read_size=16))
+    assert records == [{'text': text}, {'text': 'y'}]
+    with pytest.raises(importer.DumpError):
+        list(importer.iter_json(io.StringIO('[{"text": "x"'), read_size=4))
@@ -0,0 +1,69 @@
+import base64
+import json
+
+import pytest
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _walk_feed(client, url):
+    response = client.get(url)
+    page_obj = response.context['page_obj']
+    seen = [post.id for post in page_obj]
+    token = page_obj.next_cursor
+    assert f'after={token}' in response.content.decode(), (
+        'Убедитесь, что первая страница ленты ссылается на следующую '
+        'страницу по курсору `?after=`.'
+    )
+    while token:
+        response = client.get(url, {'after': token})
+        assert response.status_code == 200, (
+            'Убедитесь, что страница ленты по курсору `?after=` '
+            'загружается без ошибок.'
+        )
+        page_obj = response.context['page_obj']
+        seen.extend(post.id for post in page_obj)
+        token = page_obj.next_cursor
+    return seen, response
+
+
+def test_keyset_pagination(
+    user_client, user, published_category,
+    many_posts_with_published_locations
+):
+    posts = sorted(
+        many_posts_with_published_locations,
+        key=lambda post: (post.pub_date, post.id),
+        reverse=True,
+    )
+    expected = [post.id for post in posts]
+    for url in (
+        '/',
+        f'/category/{published_category.slug}/',
+        f'/profile/{user.username}/',
+    ):
+        seen, last_response = _walk_feed(user_client, url)
+        assert seen == expected, (
+            'Убедитесь, что курсорная пагинация проходит ленту '
+            '«от новых к старым» без пропусков и повторов.'
+        )
+        previous = last_response.context['page_obj'].previous_cursor
+        response = user_client.get(url, {'before': previous})
+        assert [post.id for post in response.context['page_obj']] == (
+            expected[:N_PER_PAGE]
+        ), 'Убедитесь, что курсор `?before=` возвращает предыдущую страницу.'
+
+
+@pytest.mark.parametrize('values', [None, [['x'], 1], [{}, 1], [None, 1]])
+def test_keyset_pagination_bad_cursor(user_client, values):
+    cursor = 'not-a-cursor'
+    if values is not None:
+        cursor = base64.urlsafe_b64encode(
+            json.dumps(values).encode()
+        ).decode()
+    response = user_client.get('/', {'after': cursor})
+    assert response.status_code == 404, (
+        'Убедитесь, что при неверном курсоре возвращается ошибка 404.'
+    )
@@ -0,0 +1,50 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_must_belong_to_post(
+    mixer, user, user_client, post_with_published_location
+):
+    comment = mixer.blend(
+        'blog.Comment', author=user, post=post_with_published_location
+    )
+    other_post = mixer.blend('blog.Post', author=user)
+    for action in ('edit_comment', 'delete_comment'):
+        response = user_client.get(
+            f'/posts/{other_post.id}/{action}/{comment.id}/'
+        )
+        assert response.status_code == 404, (
+            'Убедитесь, что комментарий нельзя изменить или удалить по '
+            'адресу чужой публикации.'
+        )
+
+
+def test_owner_views_load_object_once(
+    mixer, user, user_client, another_user_client,
+    post_with_published_location
+):
+    post = post_with_published_location
+    comment = mixer.blend('blog.Comment', author=user, post=post)
+    for url in (
+        f'/posts/{post.id}/delete/',
+        f'/posts/{post.id}/delete_comment/{comment.id}/',
+    ):
+        with CaptureQueriesContext(connection) as context:
+            assert user_client.get(url).status_code == 200
+        table = 'blog_comment' if 'comment' in url else 'blog_post'
+        lookups = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and f'FROM "{table}"' in query['sql']
+        ]
+        assert len(lookups) == 1, (
+            f'Убедитесь, что страница `{url}` загружает объект '
+            'одним запросом с проверкой автора.'
+        )
+        response = another_user_client.get(url)
+        assert response.status_code == 302, (
+            'Убедитесь, что не автор перенаправляется на страницу публикации.'
+        )
@@ -0,0 +1,52 @@
+import pytest
+
+from blog import metrics
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _cache_status(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return response['X-Page-Cache']
+
+
+def test_anonymous_pages_are_cached(
+    mixer, client, user_client, user, published_category, another_category,
+    post_with_published_location
+):
+    post = post_with_published_location
+    urls = (
+        '/',
+        f'/category/{published_category.slug}/',
+        f'/profile/{user.username}/',
+        f'/posts/{post.id}/',
+    )
+    assert [_cache_status(client, url) for url in urls] == ['MISS'] * 4
+    assert [_cache_status(client, url) for url in urls] == ['HIT'] * 4, (
+        'Убедитесь, что страницы для анонимных пользователей '
+        'отдаются из кеша.'
+    )
+    assert 'X-Page-Cache' not in user_client.get(urls[0]), (
+        'Убедитесь, что страницы авторизованных пользователей не кешируются.'
+    )
+    assert metrics.snapshot()['counters']['page_cache.hit'] == 4
+
+    mixer.blend('blog.Post', category=another_category)
+    assert _cache_status(client, urls[1]) == 'HIT', (
+        'Убедитесь, что публикация в другой категории не сбрасывает '
+        'кеш страницы категории.'
+    )
+    assert _cache_status(client, urls[0]) == 'MISS'
+
+    mixer.blend('blog.Comment', post=post)
+    assert [_cache_status(client, url) for url in urls] == ['MISS'] * 4, (
+        'Убедитесь, что новый комментарий сбрасывает кеш страниц, '
+        'на которых виден пост.'
+    )
+
+    user.first_name = 'Новое имя'
+    user.save()
+    assert _cache_status(client, urls[2]) == 'MISS', (
+        'Убедитесь, что изменение пользователя сбрасывает кеш его профиля.'
+    )
@@ -0,0 +1,26 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_paginator_renders_page_window(
+    mixer, user, user_client, published_category
+):
+    mixer.cycle(N_PER_PAGE * 20).blend(
+        'blog.Post', author=user, category=published_category
+    )
+    response = user_client.get('/', {'page': 10})
+    links = BeautifulSoup(
+        response.content.decode('utf-8'), features='html.parser'
+    ).select('.pagination .page-link')
+    labels = [link.get_text(strip=True) for link in links]
+    assert labels == [
+        'Первая', '<<', '1', '…', '8', '9', '10', '11', '12', '…', '20',
+        '>>', 'Последняя',
+    ], (
+        'Убедитесь, что пагинатор показывает только соседние страницы, '
+        'первую и последнюю, а пропуски заменяет многоточием.'
+    )
@@ -0,0 +1,33 @@
+import pytest
+
+from blog import metrics
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _card_counters():
+    counters = metrics.snapshot()['counters']
+    return counters['post_card.hit'], counters['post_card.miss']
+
+
+def test_post_cards_are_cached(
+    user_client, many_posts_with_published_locations
+):
+    first = user_client.get('/').content
+    assert _card_counters() == (0, N_PER_PAGE)
+    assert user_client.get('/').content == first, (
+        'Убедитесь, что карточки из кеша совпадают с отрисованными.'
+    )
+    assert _card_counters() == (N_PER_PAGE, N_PER_PAGE), (
+        'Убедитесь, что карточки публикаций берутся из кеша.'
+    )
+
+    post = user_client.get('/').context['page_obj'][0]
+    post.title = 'Новый заголовок'
+    post.save()
+    assert 'Новый заголовок' in user_client.get('/').content.decode()
+    assert _card_counters() == (3 * N_PER_PAGE - 1, N_PER_PAGE + 1), (
+        'Убедитесь, что после изменения публикации заново отрисовывается '
+        'только её карточка.'
+    )
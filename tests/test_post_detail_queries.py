@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.parametrize('client_fixture', ['user_client', 'unlogged_client'])
+def test_post_detail_query_budget(
+    request, client_fixture, mixer, post_with_published_location
+):
+    client = request.getfixturevalue(client_fixture)
+    client.get('/')
+    url = f'/posts/{post_with_published_location.id}/'
+    baseline = _count_queries(client, url)
+    for author in mixer.cycle(5).blend('auth.User'):
+        mixer.cycle(2).blend(
+            'blog.Comment', post=post_with_published_location, author=author
+        )
+    assert _count_queries(client, url) == baseline, (
+        'Убедитесь, что число SQL-запросов страницы публикации '
+        'не зависит от числа комментариев.'
+    )
+    session_queries = 2 if client_fixture == 'user_client' else 0
+    assert baseline == session_queries + 2, (
+        'Убедитесь, что публикация с категорией, местоположением и автором '
+        'загружается одним запросом, а комментарии с авторами — вторым.'
+    )
+
+
+def test_comment_page_query_budget(
+    client, mixer, post_with_published_location
+):
+    post = post_with_published_location
+    client.get('/')
+    for author in mixer.cycle(3).blend('auth.User'):
+        mixer.blend('blog.Comment', post=post, author=author)
+    first = _count_queries(client, f'/posts/{post.id}/comments/')
+    for author in mixer.cycle(12).blend('auth.User'):
+        mixer.blend('blog.Comment', post=post, author=author)
+    assert _count_queries(client, f'/posts/{post.id}/comments/') == first, (
+        'Убедитесь, что страница комментариев загружает авторов '
+        'одним запросом вместе с комментариями.'
+    )
+    assert first == 2
@@ -0,0 +1,77 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.paginators import KeysetPaginator
+from conftest import N_PER_PAGE
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != 'sqlite',
+        reason='EXPLAIN QUERY PLAN есть только в SQLite.'
+    ),
+]
+
+FULL_SCAN = re.compile(r'^SCAN (?!subquery|\(subquery)')
+TEMP_SORT = 'USE TEMP B-TREE'
+
+
+def _query_plan(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def _assert_indexed(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200, (
+        f'Убедитесь, что страница `{url}` загружается без ошибок.'
+    )
+    for query in context.captured_queries:
+        sql = query['sql']
+        if not sql.startswith('SELECT') or 'blog_' not in sql:
+            continue
+        plan = _query_plan(sql, None)
+        for step in plan:
+            assert not FULL_SCAN.match(step), (
+                f'Запрос страницы `{url}` читает таблицу целиком '
+                f'({step}):\n{sql}'
+            )
+            assert TEMP_SORT not in step, (
+                f'Запрос страницы `{url}` сортирует строки во временном '
+                f'B-дереве ({step}):\n{sql}'
+            )
+
+
+@pytest.mark.parametrize('read_model', (False, True))
+def test_feed_query_plans(
+    settings, read_model, user_client, another_user_client, unlogged_client,
+    user, published_category, many_posts_with_published_locations
+):
+    settings.BLOG_FEED_READ_MODEL = read_model
+    newest = max(
+        many_posts_with_published_locations,
+        key=lambda post: (post.pub_date, post.id)
+    )
+    cursor = KeysetPaginator(None, N_PER_PAGE).encode_cursor(newest)
+    for url in (
+        '/',
+        f'/?after={cursor}',
+        f'/category/{published_category.slug}/',
+        f'/category/{published_category.slug}/?after={cursor}',
+        f'/profile/{user.username}/',
+    ):
+        for client in (user_client, another_user_client, unlogged_client):
+            _assert_indexed(client, url)
+
+
+def test_post_detail_query_plans(
+    user_client, unlogged_client, comment_to_a_post
+):
+    url = f'/posts/{comment_to_a_post.post_id}/'
+    for client in (user_client, unlogged_client):
+        _assert_indexed(client, url)
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from blog.models import FeedEntry, ScheduledPublication
+from blog.scheduler import PublicationScheduler
+
+pytestmark = [pytest.mark.django_db]
+
+
+class FakeClock:
+
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+
+def test_scheduler_publishes_on_time(
+    settings, mixer, user, another_user_client, published_category
+):
+    settings.BLOG_FEED_READ_MODEL = True
+    now = timezone.now()
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        pub_date=now + timedelta(minutes=5)
+    )
+    assert ScheduledPublication.objects.filter(post=post).exists(), (
+        'Убедитесь, что пост с датой в будущем попадает в расписание.'
+    )
+    assert not FeedEntry.objects.filter(post=post).exists()
+    assert another_user_client.get('/').context['paginator'].count == 0
+
+    clock = FakeClock(now)
+    scheduler = PublicationScheduler(clock=clock, sleep=clock.sleep)
+    assert scheduler.publish_due() == 0
+    scheduler.run(max_interval=60, iterations=6)
+
+    assert clock.sleeps[:5] == [60, 60, 60, 60, 60], (
+        'Убедитесь, что планировщик спит не дольше заданного интервала.'
+    )
+    assert not ScheduledPublication.objects.filter(post=post).exists()
+    assert FeedEntry.objects.filter(post=post).count() == 3, (
+        'Убедитесь, что в срок публикации пост попадает во все ленты.'
+    )
+    response = another_user_client.get('/')
+    assert response.context['paginator'].count == 1, (
+        'Убедитесь, что публикация по расписанию сбрасывает кеш счётчиков.'
+    )
+    assert [item.id for item in response.context['page_obj']] == [post.id]
+
+
+def test_due_posts_refresh_cached_pages_without_worker(
+    monkeypatch, mixer, user, client, published_category
+):
+    clock = FakeClock(timezone.now())
+    monkeypatch.setattr(timezone, 'now', clock)
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        pub_date=clock.now + timedelta(minutes=5)
+    )
+    response = client.get('/')
+    etag = response['ETag']
+    assert response.context['paginator'].count == 0
+    clock.sleep(5 * 60)
+    response = client.get('/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200 and response['ETag'] != etag, (
+        'Убедитесь, что после наступления даты публикации страницы, '
+        'счётчики и ETag обновляются без фонового планировщика.'
+    )
+    assert response.context['paginator'].count == 1
+    assert [item.id for item in response.context['page_obj']] == [post.id]
+
+
+def test_due_post_is_published_once(mixer, user, published_category):
+    clock = FakeClock(timezone.now())
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        pub_date=clock.now + timedelta(minutes=5)
+    )
+    clock.sleep(5 * 60)
+    scheduler = PublicationScheduler(clock=clock)
+    stale = list(scheduler.due(clock.now))
+    assert scheduler.publish_due() == 1
+    assert [scheduler.publish(item, clock.now) for item in stale] == [
+        False
+    ], (
+        'Убедитесь, что отложенную публикацию обрабатывает только тот '
+        'процесс, который первым забрал её из расписания.'
+    )
+    assert FeedEntry.objects.filter(post=post).count() == 3
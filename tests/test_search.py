@@ -0,0 +1,75 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _found(client, query):
+    response = client.get('/search/', {'q': query})
+    assert response.status_code == 200
+    return [post.id for post in response.context['page_obj']]
+
+
+def test_search_ranks_visible_posts(
+    mixer, client, user, published_category
+):
+    in_title = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        title='Котики на крыше', text='Просто заметка.'
+    )
+    in_text = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        title='Заметка', text='Вечером на крыше сидели котики.'
+    )
+    hidden = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        title='Котики', text='Снято с публикации.', is_published=False
+    )
+    assert _found(client, 'КОТИК') == [in_title.id, in_text.id], (
+        'Убедитесь, что поиск находит публикации по заголовку и тексту, '
+        'ставит совпадения в заголовке выше и скрывает неопубликованные.'
+    )
+    in_text.text = 'Текст изменён.'
+    in_text.save()
+    hidden.delete()
+    assert _found(client, 'котики') == [in_title.id], (
+        'Убедитесь, что поисковый индекс обновляется при изменении '
+        'и удалении публикаций.'
+    )
+    assert _found(client, '" OR *') == [], (
+        'Убедитесь, что служебные символы в запросе не ломают поиск.'
+    )
+
+
+def test_rebuild_search(mixer, client, user, published_category):
+    post = mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        title='Полнотекстовый поиск'
+    )
+    call_command('rebuild_search', batch_size=1)
+    assert _found(client, 'полнотекстовый') == [post.id], (
+        'Убедитесь, что команда `rebuild_search` заново индексирует '
+        'публикации.'
+    )
+
+
+def test_search_runs_match_once(client, mixer, user, published_category):
+    mixer.cycle(3).blend(
+        'blog.Post', author=user, category=published_category,
+        title='Котики'
+    )
+    with CaptureQueriesContext(connection) as context:
+        assert len(_found(client, 'котики')) == 3
+    searches = [
+        query['sql'] for query in context.captured_queries
+        if 'MATCH' in query['sql']
+    ]
+    assert all(sql.count('MATCH') == 1 for sql in searches), (
+        'Убедитесь, что полнотекстовый запрос выполняется один раз, '
+        'а не для каждой найденной публикации.'
+    )
+    assert not any(
+        'bm25' in sql for sql in searches if 'COUNT(' in sql
+    ), 'Убедитесь, что подсчёт результатов поиска не ранжирует их.'
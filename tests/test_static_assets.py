@@ -0,0 +1,82 @@
+import gzip
+
+import pytest
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+
+from core.middleware import PreloadLinkMiddleware
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_hashed_precompressed_static(settings, tmp_path):
+    settings.STATIC_ROOT = tmp_path
+    settings.STATICFILES_STORAGE = (
+        'core.storage.CompressedManifestStaticFilesStorage'
+    )
+    call_command('collectstatic', interactive=False, verbosity=0)
+    hashed = list((tmp_path / 'css').glob('bootstrap.min.*.css'))
+    assert len(hashed) == 1, (
+        'Убедитесь, что `collectstatic` создаёт копию стилей с хешем '
+        'содержимого в имени.'
+    )
+    compressed = hashed[0].with_name(hashed[0].name + '.gz')
+    assert gzip.decompress(compressed.read_bytes()) == (
+        hashed[0].read_bytes()
+    ), 'Убедитесь, что `collectstatic` заранее сжимает стили в gzip.'
+
+    client = Client()
+    url = f'/static/css/{hashed[0].name}'
+    response = client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+    assert response.status_code == 200
+    assert response['Content-Encoding'] == 'gzip'
+    assert response['Content-Type'].startswith('text/css')
+    assert 'immutable' in response['Cache-Control'], (
+        'Убедитесь, что файлы с хешем в имени отдаются с заголовком '
+        '`Cache-Control: immutable`.'
+    )
+    response = client.get('/static/css/bootstrap.min.css')
+    assert 'Content-Encoding' not in response
+    assert 'immutable' not in response['Cache-Control']
+
+    response = client.get('/')
+    assert f'<{url}>; rel=preload; as=style' in response['Link'], (
+        'Убедитесь, что страницы отправляют заголовок `Link` с '
+        'предзагрузкой стилей.'
+    )
+    assert url in response.content.decode()
+
+
+def test_preload_keeps_existing_link_header():
+    canonical = '</posts/1/>; rel=canonical'
+
+    def get_response(request):
+        request.preload_static = True
+        response = HttpResponse()
+        response['Link'] = canonical
+        return response
+
+    response = PreloadLinkMiddleware(get_response)(
+        RequestFactory().get('/')
+    )
+    links = response['Link'].split(', ')
+    assert links[0] == canonical and len(links) > 1, (
+        'Убедитесь, что предзагрузка дописывается к уже существующему '
+        'заголовку `Link`, а не заменяет его.'
+    )
+
+
+@pytest.mark.parametrize('url, preload', [
+    ('/', True),
+    ('/pages/about/', True),
+    ('/posts/0/', False),
+    ('/admin/login/', False),
+])
+def test_preload_only_for_blog_pages(client, url, preload):
+    for _ in range(2):
+        response = client.get(url)
+        assert response.has_header('Link') == preload, (
+            'Убедитесь, что заголовок `Link` с предзагрузкой отправляют '
+            'только успешные страницы на основе `base.html`.'
+        )
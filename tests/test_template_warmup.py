@@ -0,0 +1,26 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from core.warmup import warm_up
+
+
+@pytest.fixture
+def broken_templates(settings, tmp_path):
+    (tmp_path / 'ok.html').write_text('{{ value }}')
+    (tmp_path / 'broken.html').write_text('{% if %}')
+    settings.TEMPLATES = [
+        {**settings.TEMPLATES[0], 'DIRS': [tmp_path]}
+    ]
+    settings.TEMPLATES_DIR = tmp_path
+    return settings
+
+
+def test_broken_template_raises_at_warmup(broken_templates):
+    broken_templates.TEMPLATES_PRECOMPILE = True
+    with pytest.raises(ImproperlyConfigured, match='broken.html'):
+        warm_up()
+
+
+def test_warmup_can_be_disabled(broken_templates):
+    broken_templates.TEMPLATES_PRECOMPILE = False
+    warm_up()
@@ -0,0 +1,78 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _upload(width=1600, height=1200):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), 'skyblue').save(buffer, 'JPEG')
+    return SimpleUploadedFile(
+        'photo.jpg', buffer.getvalue(), content_type='image/jpeg'
+    )
+
+
+def test_thumbnails_are_generated_on_commit(
+    settings, tmp_path, mixer, user, client, published_category,
+    django_capture_on_commit_callbacks
+):
+    settings.MEDIA_ROOT = tmp_path
+    settings.BLOG_THUMBNAIL_WORKERS = 0
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        post = mixer.blend(
+            'blog.Post', author=user, category=published_category,
+            image=_upload()
+        )
+    content = client.get(f'/posts/{post.id}/').content.decode()
+    assert 'srcset' not in content and post.image.url in content, (
+        'Убедитесь, что до подготовки превью выводится исходное фото.'
+    )
+    for callback in callbacks:
+        callback()
+    post = Post.objects.get(pk=post.pk)
+    assert post.has_thumbnails
+    for width in settings.BLOG_THUMBNAIL_WIDTHS:
+        for extension in ('webp', 'jpg'):
+            path = tmp_path / 'post_images' / 'thumbs' / (
+                f'photo-{width}.{extension}'
+            )
+            with Image.open(path) as image:
+                assert image.width == width, (
+                    'Убедитесь, что превью нарезаются по заданной ширине.'
+                )
+    content = client.get(f'/posts/{post.id}/').content.decode()
+    assert 'photo-640.webp 640w' in content, (
+        'Убедитесь, что после подготовки превью страница публикации '
+        'выводит разметку `srcset`.'
+    )
+    assert content.count('<img') == 2, (
+        'Убедитесь, что фото публикации выводится одним тегом `<img>`.'
+    )
+
+
+def test_thumbnails_are_not_upscaled(
+    settings, tmp_path, mixer, user, client, published_category,
+    django_capture_on_commit_callbacks
+):
+    settings.MEDIA_ROOT = tmp_path
+    settings.BLOG_THUMBNAIL_WORKERS = 0
+    with django_capture_on_commit_callbacks(execute=True):
+        post = mixer.blend(
+            'blog.Post', author=user, category=published_category,
+            image=_upload(1000, 750)
+        )
+    thumbs = tmp_path / 'post_images' / 'thumbs'
+    assert sorted(path.name for path in thumbs.glob('*.jpg')) == [
+        'photo-1000.jpg', 'photo-320.jpg', 'photo-640.jpg'
+    ], 'Убедитесь, что превью не нарезаются шире исходного фото.'
+    with Image.open(thumbs / 'photo-1000.webp') as image:
+        assert image.width == 1000
+    content = client.get(f'/posts/{post.id}/').content.decode()
+    assert 'photo-1000.webp 1000w' in content and '1280w' not in content, (
+        'Убедитесь, что `srcset` указывает фактическую ширину превью.'
+    )
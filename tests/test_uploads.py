@@ -0,0 +1,80 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from blog.models import Post
+from blog.uploads import SizeLimitedUploadHandler
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _image(size, image_format='PNG'):
+    buffer = BytesIO()
+    Image.new('RGB', size, 'white').save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def _create_post(client, category, content):
+    return client.post('/posts/create/', {
+        'title': 'Фото',
+        'text': 'Текст',
+        'pub_date': '2020-01-01T00:00',
+        'category': category.id,
+        'image': SimpleUploadedFile('photo.png', content),
+    })
+
+
+def test_upload_size_limit(
+    settings, tmp_path, user_client, published_category
+):
+    settings.MEDIA_ROOT = tmp_path
+    settings.BLOG_MAX_UPLOAD_SIZE = 1024
+    content = _image((300, 300), 'BMP')
+    response = _create_post(user_client, published_category, content)
+    assert response.status_code == 200 and not Post.objects.exists(), (
+        'Убедитесь, что слишком большой файл не сохраняется.'
+    )
+    errors = response.context['form'].errors.as_data()['image']
+    assert [error.code for error in errors] == ['file_too_large'], (
+        'Убедитесь, что для слишком большого файла выводится ошибка формы.'
+    )
+
+
+def test_size_limited_handler_stops_early(settings):
+    settings.BLOG_MAX_UPLOAD_SIZE = 10
+    handler = SizeLimitedUploadHandler()
+    handler.new_file('image', 'photo.png', 'image/png', None)
+    assert handler.receive_data_chunk(b'x' * 8, 0) == b'x' * 8
+    assert handler.receive_data_chunk(b'x' * 8, 8) is None, (
+        'Убедитесь, что обработчик перестаёт передавать данные дальше '
+        'после превышения лимита.'
+    )
+    assert handler.receive_data_chunk(b'x' * 8, 16) is None
+    assert handler.file_complete(24).oversized
+    handler.new_file('image', 'photo.png', 'image/png', None)
+    handler.receive_data_chunk(b'x' * 8, 0)
+    assert handler.file_complete(8) is None, (
+        'Убедитесь, что файлы в пределах лимита сохраняют следующие '
+        'обработчики загрузки.'
+    )
+
+
+def test_upload_pixel_limit(
+    settings, tmp_path, user_client, published_category
+):
+    settings.MEDIA_ROOT = tmp_path
+    settings.BLOG_MAX_IMAGE_PIXELS = 100 * 100
+    response = _create_post(
+        user_client, published_category, _image((101, 100))
+    )
+    assert 'image' in response.context['form'].errors, (
+        'Убедитесь, что изображения с большим числом пикселей отклоняются.'
+    )
+    response = _create_post(
+        user_client, published_category, _image((100, 100))
+    )
+    assert response.status_code == 302 and Post.objects.get().image, (
+        'Убедитесь, что изображения в пределах лимита сохраняются.'
+    )